@@ -0,0 +1,20 @@
+"""산업용 주요고객 분석 대시보드의 데이터 처리 모듈 모음.
+
+Streamlit 없이도 사용할 수 있도록 모든 함수는 일반 인자를 받아 DataFrame·배열·그림을 반환합니다.
+
+- storage: 요약 데이터 로드/저장 (Parquet 우선, CSV 대체)
+- customers: 고객 차원 테이블과 정수 고객ID 변환
+- dataset: 여러 세션이 공유하는 읽기 전용 요약 데이터셋
+- units: 분석 단위 변환
+- ranking: 연도별 순위 인덱스, TOP N, 순위표·고객별 표
+- matrix: 월별 순위 보고서용 고객×월 행렬
+- report: 보고서 HTML 렌더링
+- race: 막대 레이스 데이터·그림
+- charts: 연도별 추이 그래프
+- pipeline: 원본 추출 파일 요약 (명령행)
+- query: 원본 추출 파일 직접 조회 (DuckDB, 선택 기능)
+- profiling: 페이지 실행 단계별 시간·크기 측정과 기록
+- prefetch: 크기가 정해진 LRU 캐시와 백그라운드 선계산
+- export: 조회 결과 내보내기 (CSV, Excel, Parquet)
+- growth: 고객별 성장·감소 지표 (최근 12개월, 증감, CAGR, 계절성)
+"""
@@ -0,0 +1,87 @@
+"""연도별 추이 그래프 생성.
+
+표준 모드는 plotly express 선 그래프를 그대로 사용합니다. 경량 모드는 WebGL(Scattergl)
+trace를 고객별로 직접 만들고 숫자 배열을 numpy 배열로 넘겨 base64로 압축 전송되게
+하며(연도는 int16, 값은 수치가 바뀌지 않도록 float64), 점 위 수치는 마지막 연도에만 표시합니다(나머지는 hover로 확인).
+두 모드 모두 선 끝 고객명 표시와 x unified hover를 유지합니다.
+"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+PALETTE = px.colors.qualitative.Plotly
+
+
+def figure_payload_size(fig):
+    """그림 JSON 크기 (byte)."""
+    return len(fig.to_json().encode('utf-8'))
+
+
+def _line_figure(df_plot, target_col, title, show_labels):
+    fig = px.line(
+        df_plot, x='매출년도', y=target_col, color='고객명', markers=True,
+        text=target_col if show_labels else None,
+        title=title,
+        template='plotly_white'
+    )
+    fig.update_traces(
+        textposition="top center", 
+        texttemplate='%{y:,.0f}',
+        line=dict(width=3),
+        showlegend=False 
+    )
+    return fig
+
+
+def _webgl_figure(df_plot, target_col, title, show_labels):
+    # df_plot은 (고객명, 매출년도) 순으로 정렬되어 있으므로 고객별 구간만 잘라서 사용
+    names = df_plot['고객명'].to_numpy()
+    years = df_plot['매출년도'].to_numpy(dtype=np.int16)
+    values = df_plot[target_col].to_numpy(dtype=np.float64)
+    starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]])
+    ends = np.r_[starts[1:], len(names)]
+
+    fig = go.Figure(layout=go.Layout(title=title, template='plotly_white'))
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        fig.add_trace(go.Scattergl(
+            x=years[start:end], y=values[start:end], name=names[start],
+            mode='lines+markers', line=dict(width=3, color=PALETTE[i % len(PALETTE)]),
+            hovertemplate='%{y:,.0f}', showlegend=False
+        ))
+
+    if show_labels and len(names):
+        last = ends - 1
+        fig.add_trace(go.Scattergl(
+            x=years[last], y=values[last], mode='text',
+            text=[f'{v:,.0f}' for v in values[last].tolist()], textposition='top center',
+            hoverinfo='skip', showlegend=False
+        ))
+    return fig
+
+
+def trend_figure(df_plot, target_col, last_rows, title, height, unit_label, show_labels=True, webgl=False):
+    """고객별 연도 추이 선 그래프를 만듭니다. last_rows는 고객별 마지막 연도 행입니다."""
+    build = _webgl_figure if webgl else _line_figure
+    fig = build(df_plot, target_col, title, show_labels)
+
+    # 선 끝에 이름 및 지시선 표시
+    line_colors = {trace.name: trace.line.color for trace in fig.data if trace.name}
+    for customer, year, value in last_rows[['고객명', '매출년도', target_col]].itertuples(index=False):
+        fig.add_annotation(
+            x=year, 
+            y=value,
+            text=f"<b>{customer}</b>",
+            showarrow=True, arrowhead=0,
+            arrowcolor=line_colors[customer],
+            ax=60, ay=0, xanchor="left",
+            font=dict(size=12, color=line_colors[customer])
+        )
+
+    fig.update_layout(
+        height=height,
+        margin=dict(r=200, t=100), 
+        hovermode="x unified",
+        xaxis=dict(tickmode='linear', dtick=1),
+        yaxis=dict(title=f"판매량 ({unit_label})", tickformat=",.0f", gridcolor='lightgrey')
+    )
+    return fig
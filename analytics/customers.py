@@ -0,0 +1,84 @@
+"""고객 차원 테이블과 정수 고객ID 변환.
+
+고객명은 띄어쓰기나 법인 표기((주), 주식회사, (유), 유한회사 등)만 다른 변형이 섞여
+있으므로, 이를 제거한 매칭키가 같으면 같은 고객으로 보고 하나의 고객ID(int32)를
+부여합니다. 대표 고객명은 변형 중 사용량 합계가 가장 큰 이름입니다.
+
+차원 테이블: index=고객ID, 열=고객명(대표 이름), 매칭키
+요약(fact) 테이블은 고객ID만 가지고, 이름은 화면에 표시할 행에만 붙입니다.
+"""
+import numpy as np
+import pandas as pd
+
+# NFKC 정규화 후 제거할 법인 표기 (㈜, （주） 등은 NFKC에서 (주)로 바뀜)
+CORPORATE_MARKERS = r'\(주\)|주식회사|\(유\)|유한회사|\(합\)|합자회사'
+
+
+def match_key(names):
+    """고객명 Series를 매칭키 Series로 변환합니다 (고유값만 계산)."""
+    names = pd.Series(names, dtype=object).astype(str)
+    uniques = pd.Series(pd.unique(names), dtype=str)
+    keys = (uniques.str.normalize('NFKC')
+            .str.replace(CORPORATE_MARKERS, '', regex=True)
+            .str.replace(r'\s+', '', regex=True)
+            .str.lower())
+    # 법인 표기만으로 된 이름은 원래 이름을 키로 사용
+    keys = keys.where(keys != '', uniques)
+    return names.map(dict(zip(uniques, keys)))
+
+
+def build_dimension(names, weights=None, existing=None):
+    """고객명(과 사용량 가중치)으로 차원 테이블을 만듭니다.
+
+    existing을 주면 기존 고객ID는 그대로 두고 새 매칭키만 뒤에 추가합니다.
+    """
+    names = pd.Series(names, dtype=object).astype(str).reset_index(drop=True)
+    weights = pd.Series(1.0, index=names.index) if weights is None else pd.Series(weights).reset_index(drop=True)
+    variants = weights.groupby(names).sum().rename('가중치').rename_axis('고객명').reset_index()
+    variants['매칭키'] = match_key(variants['고객명']).to_numpy()
+
+    canonical = variants.sort_values(['가중치', '고객명'], ascending=[False, True]).drop_duplicates('매칭키')
+    canonical = canonical.sort_values('고객명')[['고객명', '매칭키']]
+
+    start = 0
+    if existing is not None and len(existing):
+        canonical = canonical[~canonical['매칭키'].isin(existing['매칭키'])]
+        start = int(existing.index.max()) + 1
+    canonical.index = pd.RangeIndex(start, start + len(canonical), name='고객ID')
+    if existing is not None:
+        canonical = pd.concat([existing, canonical])
+    canonical.index = canonical.index.astype('int32')
+    canonical.index.name = '고객ID'
+    return canonical
+
+
+def customer_ids(names, dimension):
+    """고객명 Series를 고객ID 배열(int32)로 변환합니다. 차원에 없는 이름이 있으면 KeyError."""
+    key_to_id = pd.Series(dimension.index.to_numpy(), index=dimension['매칭키'].to_numpy())
+    ids = match_key(names).map(key_to_id)
+    if ids.isna().any():
+        missing = pd.Series(names)[ids.isna().to_numpy()].unique()[:5]
+        raise KeyError(f"고객 차원 테이블에 없는 고객명: {', '.join(map(str, missing))}")
+    return ids.to_numpy(dtype=np.int32)
+
+
+def canonical_names(names, dimension):
+    """고객명 변형을 대표 고객명으로 바꿉니다."""
+    return dimension['고객명'].reindex(customer_ids(names, dimension)).to_numpy()
+
+
+def intern(frame, dimension, measures=('사용량', '사용열량')):
+    """고객명 열을 고객ID로 바꾸고, 변형이 합쳐진 행은 다시 합산합니다."""
+    out = frame.drop(columns='고객명')
+    out.insert(0, '고객ID', customer_ids(frame['고객명'], dimension))
+    keys = [c for c in out.columns if c not in measures]
+    if out.duplicated(keys).any():
+        out = out.groupby(keys, sort=False, observed=True)[list(measures)].sum().reset_index()
+    return out
+
+
+def attach_names(frame, names):
+    """고객ID 열 옆에 고객명 열을 붙입니다. names는 고객ID → 고객명 Series."""
+    out = frame.copy()
+    out.insert(out.columns.get_loc('고객ID') + 1, '고객명', names.reindex(out['고객ID'].to_numpy()).to_numpy())
+    return out
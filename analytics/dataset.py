@@ -0,0 +1,101 @@
+"""여러 세션이 함께 쓰는 읽기 전용 요약 데이터셋.
+
+요약 파일을 프로세스당 한 번만 읽고(Parquet은 메모리 맵으로 읽음), 화면마다 반복하던
+파생 값(연도 목록, 상품 목록, 총 고객 수·총 판매량)도 로드할 때 한 번만 계산해 둡니다.
+
+분할 저장된 월별 요약은 처음에 통계용 열(고객ID, 사용량)만 읽고, 연도·상품 목록은 폴더
+이름에서 가져옵니다. 전체 DataFrame은 frame()으로 처음 요청될 때 읽고, 연도별 화면은
+partition()으로 해당 연도·상품 폴더만 읽습니다.
+
+frame()은 공유 DataFrame의 얕은 복사본을 돌려줍니다. Copy-on-Write(pandas 3 기본,
+requirements.txt에서 pandas>=3으로 고정) 덕분에 복사 비용이 거의 없고, 받은 쪽에서 열을
+추가하거나 값을 바꿔도 공유 데이터는 바뀌지 않습니다. 공유 데이터의 numpy 배열은 읽기
+전용으로 바꿔 두므로, Copy-on-Write가 없는 환경에서 제자리 수정을 시도하면 조용히 공유
+데이터를 바꾸지 않고 오류가 납니다.
+"""
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from analytics import storage
+
+
+@dataclass(frozen=True)
+class SummaryStats:
+    years: tuple      # 매출년도 내림차순
+    products: tuple   # 상품 이름순 (상품 열이 없으면 빈 튜플)
+    customers: int
+    volume: float     # 사용량 합계 (㎥)
+
+
+def summary_stats(frame, partitions=None):
+    """요약 DataFrame의 화면용 파생 값을 계산합니다. partitions가 있으면 연도·상품 목록은 거기서 가져옵니다."""
+    if partitions is None:
+        partitions = {col: frame[col].unique().tolist() for col in ['매출년도', '상품'] if col in frame.columns}
+    return SummaryStats(
+        years=tuple(sorted(partitions['매출년도'], reverse=True)),
+        products=tuple(sorted(partitions.get('상품', []))),
+        customers=int(frame['고객ID'].nunique()),
+        volume=float(frame['사용량'].sum()),
+    )
+
+
+def freeze(frame):
+    """DataFrame 열의 numpy 배열(과 그 원본 배열)을 읽기 전용으로 바꿔 반환합니다."""
+    if frame is None:
+        return None
+    for _, column in frame.items():
+        values = column.values
+        while isinstance(values, np.ndarray):
+            values.flags.writeable = False
+            values = values.base
+    return frame
+
+
+class SharedDataset:
+    """데이터 폴더의 요약 파일 전체와 고객 차원 테이블 (읽기 전용)."""
+
+    def __init__(self, data_dir=storage.DATA_DIR):
+        self.data_dir = data_dir
+        self.dimension = freeze(storage.read_customers(data_dir))
+        self.names = None if self.dimension is None else self.dimension['고객명']
+        self._frames = {}
+        self._lock = threading.Lock()
+        self.stats = {}
+        for name in storage.SUMMARIES:
+            partitions = storage.partition_values(name, data_dir)
+            if partitions is None:
+                frame = freeze(storage.read_summary(name, data_dir, self.dimension, memory_map=True))
+                if frame is not None:
+                    self._frames[name] = frame
+                    self.stats[name] = summary_stats(frame)
+            else:
+                totals = storage.read_summary(name, data_dir, columns=['고객ID', '사용량'])
+                self.stats[name] = summary_stats(totals, partitions)
+
+    def frame(self, name):
+        """요약 DataFrame 전체 (공유 데이터의 얕은 복사본). 파일이 없으면 None."""
+        if name not in self.stats:
+            return None
+        with self._lock:
+            if name not in self._frames:
+                self._frames[name] = freeze(storage.read_summary(name, self.data_dir, self.dimension,
+                                                                 memory_map=True))
+        return self._frames[name].copy(deep=False)
+
+    def partition(self, name, year, products=None):
+        """해당 연도(와 상품)의 행만 읽습니다. 분할 저장된 요약은 해당 폴더만 읽습니다."""
+        if name not in self.stats:
+            return None
+        if name in self._frames:
+            frame = self._frames[name]
+            mask = frame['매출년도'] == year
+            if products is not None and '상품' in frame.columns:
+                mask &= frame['상품'].isin(list(products))
+            return frame[mask]
+        return storage.read_summary(name, self.data_dir, self.dimension, years=[year], products=products)
+
+    def customer_names(self):
+        """고객ID → 대표 고객명 Series (얕은 복사본). 차원 테이블이 없으면 None."""
+        return None if self.names is None else self.names.copy(deep=False)
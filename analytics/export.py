@@ -0,0 +1,92 @@
+"""조회 결과 내보내기 (CSV, Excel, Parquet).
+
+결과 DataFrame을 chunk_rows행씩 나눠 파일 객체에 바로 쓰므로, 큰 결과도 파일 전체를
+담은 중간 문자열(DataFrame.to_csv 결과 등)을 따로 만들지 않습니다.
+- CSV: 조각마다 UTF-8(BOM 포함, 엑셀 호환)로 인코딩해 씀
+- Parquet: 조각마다 행 그룹 하나
+- Excel: openpyxl이 설치되어 있을 때만 사용 (pip install openpyxl), 쓰기 전용 통합 문서에 행 추가
+
+인덱스는 일반 열로 바꾸고, 열 이름은 문자열로 씁니다.
+"""
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import openpyxl
+except ImportError:  # 선택 의존성
+    openpyxl = None
+
+# 형식 → (확장자, MIME 형식)
+FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+CHUNK_ROWS = 50000
+
+
+def available_formats():
+    """이 환경에서 쓸 수 있는 형식 목록."""
+    return [fmt for fmt in FORMATS if fmt != "Excel" or openpyxl is not None]
+
+
+def file_name(stem, fmt):
+    return f"{stem}.{FORMATS[fmt][0]}"
+
+
+def mime_type(fmt):
+    return FORMATS[fmt][1]
+
+
+def _flatten(frame):
+    # 이름 있는 인덱스는 열로 꺼내고 열 이름을 문자열로 통일
+    if any(name is not None for name in frame.index.names):
+        frame = frame.reset_index()
+    return frame.rename(columns=str)
+
+
+def _chunks(frame, chunk_rows):
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def _write_csv(frame, out, chunk_rows):
+    for i, chunk in enumerate(_chunks(frame, chunk_rows)):
+        out.write(chunk.to_csv(index=False, header=i == 0).encode('utf-8-sig' if i == 0 else 'utf-8'))
+
+
+def _write_parquet(frame, out, chunk_rows):
+    schema = pa.Schema.from_pandas(frame, preserve_index=False)
+    with pq.ParquetWriter(out, schema) as writer:
+        for chunk in _chunks(frame, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_excel(frame, out, chunk_rows):
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet()
+    sheet.append(list(frame.columns))
+    for chunk in _chunks(frame, chunk_rows):
+        for row in chunk.itertuples(index=False):
+            sheet.append(list(row))
+    book.save(out)
+
+
+WRITERS = {"CSV": _write_csv, "Excel": _write_excel, "Parquet": _write_parquet}
+
+
+def write_export(frame, fmt, out, chunk_rows=CHUNK_ROWS):
+    """frame을 fmt 형식으로 바이너리 파일 객체 out에 chunk_rows행씩 씁니다."""
+    if fmt not in available_formats():
+        raise ValueError(f"사용할 수 없는 내보내기 형식: {fmt}")
+    WRITERS[fmt](_flatten(frame), out, chunk_rows)
+
+
+def export_bytes(frame, fmt, chunk_rows=CHUNK_ROWS):
+    """frame을 fmt 형식의 파일 내용(bytes)으로 만듭니다."""
+    buffer = io.BytesIO()
+    write_export(frame, fmt, buffer, chunk_rows)
+    return buffer.getvalue()
@@ -0,0 +1,146 @@
+"""고객별 성장·감소 분석 (월별 요약 기준).
+
+월별 요약 전체를 고객×월 밀집 행렬(전체 기간, 연도 단위로 채움) 하나로 만들어 두고,
+연도 범위가 바뀌면 행렬을 잘라 모든 고객의 지표를 한꺼번에 계산합니다.
+- 연도별 합계: 범위 열을 (고객, 연도, 월)로 바꿔 합산
+- 최근 12개월 합계: 누적합의 차이 (마지막 데이터 월 기준, 전년 동기 12개월과 비교)
+- 증감·증감률: 범위 첫 연도 대비 마지막 연도
+- CAGR: 첫 연도와 마지막 연도 합계가 모두 양수인 고객만 계산
+- 계절성: 범위 내 달력 월별 비중과 최대 비중 월
+
+고객별 반복문 없이 배열 연산만 쓰며, 고객명은 뽑힌 상·하위 고객에만 붙입니다.
+값은 기준 단위(㎥·MJ)이고 단위 변환은 화면에서 결과에만 적용합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics.matrix import MONTHS
+
+# 순위 기준 → 지표 열
+MOVER_BASES = {
+    "증감": '증감',
+    "증감률": '증감률',
+    "CAGR": 'CAGR',
+    "최근 12개월 증감": '12개월증감',
+}
+# 단위 변환 대상 열 (나머지는 비율)
+VALUE_COLUMNS = ['기준연도합계', '최종연도합계', '증감', '최근12개월', '전년동기12개월', '12개월증감']
+
+
+class GrowthMatrix:
+    """전체 기간 고객×월 행렬 (기준 단위, 첫 연도 1월부터 마지막 연도 12월까지)."""
+
+    def __init__(self, monthly, metric, names):
+        first_year = int(monthly['매출년도'].min())
+        last_year = int(monthly['매출년도'].max())
+        periods = ((monthly['매출년도'].to_numpy(dtype=np.int64) - first_year) * 12
+                   + monthly['월'].to_numpy(dtype=np.int64) - 1)
+        codes, customers = pd.factorize(monthly['고객ID'], sort=True)
+        n_periods = (last_year - first_year + 1) * 12
+
+        values = np.bincount(codes * n_periods + periods, weights=monthly[metric].to_numpy(dtype=np.float64),
+                             minlength=len(customers) * n_periods)
+        self.metric = metric
+        self.names = names
+        self.customers = np.asarray(customers)
+        self.values = values.reshape(len(customers), n_periods)
+        self.first_year = first_year
+        self.years = list(range(first_year, last_year + 1))
+        # 데이터가 있는 마지막 월 다음 열 (마지막 연도가 진행 중이면 12월보다 앞)
+        self.end_period = int(periods.max()) + 1
+
+    def __len__(self):
+        return len(self.customers)
+
+    def _columns(self, year_from, year_to):
+        return (year_from - self.first_year) * 12, (year_to - self.first_year + 1) * 12
+
+    def last_month(self):
+        """데이터가 있는 마지막 월 ('YYYY-MM')."""
+        period = self.end_period - 1
+        return f'{self.first_year + period // 12}-{period % 12 + 1:02d}'
+
+    def rolling_totals(self, customers, window=12):
+        """지정 고객ID들의 월별 최근 window개월 합계 (고객 × 'YYYY-MM', window번째 월부터 마지막 데이터 월까지)."""
+        rows = np.searchsorted(self.customers, np.asarray(customers))
+        cumulative = np.cumsum(self.values[rows, :self.end_period], axis=1)
+        rolling = cumulative[:, window - 1:].copy()
+        rolling[:, 1:] -= cumulative[:, :-window]
+        labels = [f'{self.first_year + p // 12}-{p % 12 + 1:02d}' for p in range(window - 1, self.end_period)]
+        return pd.DataFrame(rolling, index=pd.Index(customers, name='고객ID'), columns=labels)
+
+    def growth_table(self, year_from, year_to):
+        """범위 내 사용 실적이 있는 모든 고객의 성장 지표 (고객ID 인덱스)."""
+        start, end = self._columns(year_from, year_to)
+        n_years = year_to - year_from + 1
+        by_year = self.values[:, start:end].reshape(len(self), n_years, 12).sum(axis=2)
+        first, last = by_year[:, 0], by_year[:, -1]
+
+        # 최근 12개월과 전년 동기 12개월 (범위 끝과 마지막 데이터 월 중 이른 쪽 기준)
+        rolling_end = min(end, self.end_period)
+        recent = self.values[:, max(rolling_end - 12, 0):rolling_end].sum(axis=1)
+        if rolling_end >= 24:
+            previous = self.values[:, rolling_end - 24:rolling_end - 12].sum(axis=1)
+        else:
+            previous = np.full(len(self), np.nan)
+
+        by_month = self.values[:, start:end].reshape(len(self), n_years, 12).sum(axis=1)
+        totals = by_month.sum(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_rate = np.where(first > 0, last / first - 1, np.nan)
+            cagr = (np.where((first > 0) & (last > 0), (last / first) ** (1 / (n_years - 1)) - 1, np.nan)
+                    if n_years > 1 else np.full(len(self), np.nan))
+            shares = by_month / totals[:, None]
+
+        table = pd.DataFrame({
+            '기준연도합계': first,
+            '최종연도합계': last,
+            '증감': last - first,
+            '증감률': change_rate,
+            'CAGR': cagr,
+            '최근12개월': recent,
+            '전년동기12개월': previous,
+            '12개월증감': recent - previous,
+            '최대월': by_month.argmax(axis=1) + 1,
+            '최대월비중': shares.max(axis=1),
+        }, index=pd.Index(self.customers, name='고객ID'))
+        return table[totals > 0]
+
+    def seasonality(self, year_from, year_to, customers):
+        """지정 고객ID들의 범위 내 달력 월별 비중 (고객 × 1~12월)."""
+        start, end = self._columns(year_from, year_to)
+        rows = np.searchsorted(self.customers, np.asarray(customers))
+        by_month = self.values[rows, start:end].reshape(len(rows), -1, 12).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shares = by_month / by_month.sum(axis=1, keepdims=True)
+        return pd.DataFrame(shares, index=pd.Index(customers, name='고객ID'), columns=MONTHS)
+
+
+def top_movers(table, basis, n=10, min_base=0):
+    """지표 basis 기준 상위(성장)·하위(감소) n개 고객을 반환합니다.
+
+    기준 연도 합계가 min_base 미만인 고객은 제외하고(작은 고객의 증감률 왜곡 방지),
+    지표가 없는(NaN) 고객도 제외합니다. 성장은 지표가 양수, 감소는 음수인 고객만 남깁니다.
+    """
+    column = MOVER_BASES[basis]
+    scores = table[column].to_numpy()
+    eligible = (table['기준연도합계'].to_numpy() >= min_base) & ~np.isnan(scores)
+    candidates = table[eligible]
+    scores = scores[eligible]
+
+    def pick(sign):
+        picked = np.flatnonzero(sign * scores > 0)
+        k = min(n, len(picked))
+        if k == 0:
+            return candidates.iloc[:0]
+        top = picked[np.argpartition(-sign * scores[picked], k - 1)[:k]]
+        top = top[np.argsort(-sign * scores[top], kind='stable')]
+        return candidates.iloc[top]
+
+    return [pick(1), pick(-1)]
+
+
+def with_names(rows, names):
+    """고객ID 인덱스를 고객명으로 바꿉니다."""
+    return rows.set_axis(names.reindex(rows.index).to_numpy()).rename_axis('고객명')
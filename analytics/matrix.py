@@ -0,0 +1,73 @@
+"""월별 순위 보고서용 고객×월 밀집 행렬.
+
+연도(및 상품 선택)·지표별로 고객ID 배열과 12개월 float64 행렬, 연간 합계를 만들어
+연간 합계 내림차순으로 정렬해 둡니다. 순위 범위는 배열 슬라이싱으로, 최소 연간 합계
+조건은 이진 탐색으로 처리하므로 순위 범위를 바꿀 때 다시 집계하지 않습니다.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics import units
+
+MONTHS = list(range(1, 13))
+
+
+class MonthlyMatrix:
+    """연간 합계 내림차순으로 정렬된 고객×월 행렬 (기준 단위).
+
+    customers는 고객ID 배열이며, names(고객ID → 고객명)는 window()로 꺼낸 행에만 적용합니다.
+    """
+
+    def __init__(self, customers, values, names):
+        totals = values.sum(axis=1)
+        # 연간 합계 내림차순, 동률은 고객ID 순
+        order = np.argsort(-totals, kind='stable')
+        self.names = names
+        self.customers = customers[order]
+        self.values = values[order]
+        self.totals = totals[order]
+
+    def __len__(self):
+        return len(self.customers)
+
+    def count_at_least(self, min_total):
+        """연간 합계가 min_total 이상인 고객 수 (정렬된 합계에서 이진 탐색)."""
+        return int(np.searchsorted(-self.totals, -min_total, side='right'))
+
+    def window_size(self, start_rank, end_rank, min_total=0):
+        """window()가 반환할 행 수."""
+        return max(min(end_rank, self.count_at_least(min_total)) - (max(start_rank, 1) - 1), 0)
+
+    def window(self, start_rank, end_rank, min_total=0):
+        """start_rank~end_rank위 중 연간 합계가 min_total 이상인 행을 DataFrame으로 반환합니다."""
+        start = max(start_rank, 1) - 1
+        end = min(end_rank, self.count_at_least(min_total))
+        if end <= start:
+            return pd.DataFrame(columns=['순위', *MONTHS, '연간 합계'])
+        index = pd.Index(self.names.reindex(self.customers[start:end]).to_numpy(), name='고객명')
+        frame = pd.DataFrame(self.values[start:end], index=index, columns=MONTHS)
+        frame['연간 합계'] = self.totals[start:end]
+        frame.insert(0, '순위', np.arange(start + 1, end + 1))
+        return frame
+
+
+def build_monthly_matrix(df, year, metric, names, products=None):
+    """월별 요약(고객ID, 매출년도, 월, [상품], 지표)에서 해당 연도의 MonthlyMatrix를 만듭니다."""
+    mask = df['매출년도'] == year
+    if products is not None:
+        mask &= df['상품'].isin(products)
+    rows = df.loc[mask, ['고객ID', '월', metric]]
+
+    codes, customers = pd.factorize(rows['고객ID'], sort=True)
+    cells = codes * 12 + (rows['월'].to_numpy(dtype=np.int64) - 1)
+    values = np.bincount(cells, weights=rows[metric].to_numpy(dtype=np.float64), minlength=len(customers) * 12)
+    return MonthlyMatrix(np.asarray(customers), values.reshape(len(customers), 12), names)
+
+
+def report_window(matrix, start_rank, end_rank, min_value, unit_option):
+    """보고서 행(표시 단위)과 선택범위 합계를 반환합니다. min_value는 표시 단위 값입니다."""
+    window = matrix.window(start_rank, end_rank, units.to_base(min_value, unit_option))
+    values = units.from_base(window.drop(columns='순위'), unit_option)
+    total = values.sum()
+    values.insert(0, '순위', window['순위'])
+    return values, total
@@ -0,0 +1,251 @@
+"""원본 추출 파일(output_v2.csv)을 한 번만 읽어 요약 CSV들을 생성하는 파이프라인.
+
+파일을 줄 경계에 맞춘 바이트 구간으로 나눈 뒤 프로세스 풀에서 구간별로
+(상품명, 고객명, 매출년월) 합계를 구하고, 메인 프로세스에서 다시 합산합니다.
+따옴표 안에 줄바꿈이 들어간 필드는 지원하지 않습니다.
+
+증분 모드(--incremental)에서는 새로 추출한 월 단위 원본만 읽어 기존 요약에 병합합니다.
+이미 반영된 매출년월은 manifest 파일(ingest_manifest.json)에 기록되며, 같은 월을 다시
+넣으면 건너뜁니다(--replace 지정 시 해당 월을 새 데이터로 교체).
+
+사용 예:
+    python -m analytics.pipeline D:/project2/data/output_v2.csv --out data
+    python -m analytics.pipeline D:/project2/data/output_202501.csv --out data --incremental
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+from analytics import customers, storage
+
+# 원본 열 이름: 상품명, 고객명, 매출년월, 사용량(m3), 사용량(mj)
+RAW_COLUMNS = ['상품명', '고객명', '매출년월', '사용량(m3)', '사용량(mj)']
+RAW_MEASURES = {'사용량(m3)': '사용량', '사용량(mj)': '사용열량'}
+GROUP_KEYS = ['상품명', '고객명', '매출년월']
+
+INDUSTRIAL_PRODUCT = '산업용'
+# 업무용 페이지에 포함할 상품명 판별 기준 (상품명에 포함된 문자열)
+COMMERCIAL_KEYWORD = '업무'
+
+
+MANIFEST_FILE = 'ingest_manifest.json'
+
+DEFAULT_BLOCK_SIZE = 64 * 1024 * 1024
+
+
+def split_byte_ranges(file_path, block_size=DEFAULT_BLOCK_SIZE):
+    """헤더 이후 본문을 줄 경계에 맞춘 (시작, 끝) 바이트 구간 목록으로 나눕니다."""
+    file_size = os.path.getsize(file_path)
+    ranges = []
+    with open(file_path, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        while start < file_size:
+            f.seek(min(start + block_size, file_size))
+            if f.tell() < file_size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def read_header(file_path, encoding='utf-8'):
+    with open(file_path, 'rb') as f:
+        header = f.readline().decode(encoding).lstrip('\ufeff').strip()
+    return next(csv.reader([header]))
+
+
+def aggregate_range(file_path, start, end, names, encoding='utf-8'):
+    """바이트 구간 하나를 읽어 (상품명, 고객명, 매출년월) 단위로 합산합니다."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    chunk = pd.read_csv(
+        io.BytesIO(raw), header=None, names=names, usecols=RAW_COLUMNS,
+        encoding=encoding, dtype={'상품명': str, '고객명': str, '매출년월': str},
+    )
+    return chunk.groupby(GROUP_KEYS, sort=False)[list(RAW_MEASURES)].sum()
+
+
+def normalize_period(values):
+    """'2020-01', '2020-01-01', '202001' 등 다양한 매출년월 표기를 'YYYY-MM'으로 통일합니다."""
+    uniques = pd.Series(pd.unique(values))
+    digits = uniques.str.replace(r'\D', '', regex=True).str[:6]
+    mapping = dict(zip(uniques, digits.str[:4] + '-' + digits.str[4:6]))
+    return values.map(mapping)
+
+
+def summarize_raw(file_path, workers=None, block_size=DEFAULT_BLOCK_SIZE, encoding='utf-8'):
+    """원본 파일 전체를 한 번 읽어 상품·고객·월 단위 합계 DataFrame을 반환합니다."""
+    names = read_header(file_path, encoding)
+    ranges = split_byte_ranges(file_path, block_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(aggregate_range, file_path, s, e, names, encoding) for s, e in ranges]
+        parts = [fut.result() for fut in futures]
+
+    if not parts:
+        return pd.DataFrame(columns=['상품명', '고객명', '매출년월', '사용량', '사용열량'])
+
+    combined = pd.concat(parts).reset_index()
+    combined['매출년월'] = normalize_period(combined['매출년월'])
+    summary = combined.groupby(GROUP_KEYS)[list(RAW_MEASURES)].sum().reset_index()
+    return summary.rename(columns=RAW_MEASURES)
+
+
+def yearly_from_monthly(monthly):
+    yearly = monthly.assign(매출년도=monthly['매출년월'].str[:4].astype(int))
+    return yearly.groupby(['고객명', '매출년도'])[['사용량', '사용열량']].sum().reset_index()
+
+
+def build_outputs(summary, commercial_keyword=COMMERCIAL_KEYWORD, dimension=None):
+    """상품·고객·월 합계에서 페이지별 요약 테이블과 고객 차원 테이블을 만듭니다.
+
+    dimension(기존 고객 차원)을 주면 기존 고객ID를 유지하고 새 고객만 추가합니다.
+    """
+    # 고객명 변형((주), 띄어쓰기 등)을 대표 고객명으로 통일
+    dimension = customers.build_dimension(summary['고객명'], summary['사용량'], existing=dimension)
+    summary = summary.assign(고객명=customers.canonical_names(summary['고객명'], dimension))
+
+    industry = summary[summary['상품명'] == INDUSTRIAL_PRODUCT]
+
+    monthly = industry.groupby(['고객명', '매출년월'])[['사용량', '사용열량']].sum().reset_index()
+    yearly = yearly_from_monthly(monthly)
+
+    commercial = summary[summary['상품명'].str.contains(commercial_keyword, na=False)]
+    commercial = commercial.rename(columns={'상품명': '상품'})
+    commercial = commercial.groupby(['고객명', '매출년월', '상품'])[['사용량', '사용열량']].sum().reset_index()
+
+    outputs = {
+        storage.YEARLY_SUMMARY: yearly,
+        storage.MONTHLY_SUMMARY: monthly,
+        storage.COMMERCIAL_SUMMARY: commercial,
+    }
+    return outputs, dimension
+
+
+def write_outputs(outputs, dimension, out_dir, years=None):
+    """요약 CSV(대표 고객명), Parquet(고객ID, 월별 요약은 연도·상품 분할), 고객 차원 테이블을 저장합니다.
+
+    years를 주면 분할 저장하는 월별 요약은 해당 연도 폴더만 다시 씁니다 (증분 반영).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    storage.write_customers(dimension, out_dir)
+    for name, frame in outputs.items():
+        frame.to_csv(os.path.join(out_dir, f'{name}.csv'), index=False, encoding='utf-8-sig')
+        storage.write_summary(name, frame, out_dir, dimension, years)
+
+
+def read_outputs(out_dir):
+    """기존 요약 CSV를 읽습니다. 파일이 없으면 빈 DataFrame을 반환합니다."""
+    columns = {
+        storage.YEARLY_SUMMARY: ['고객명', '매출년도', '사용량', '사용열량'],
+        storage.MONTHLY_SUMMARY: ['고객명', '매출년월', '사용량', '사용열량'],
+        storage.COMMERCIAL_SUMMARY: ['고객명', '매출년월', '상품', '사용량', '사용열량'],
+    }
+    outputs = {}
+    for name, cols in columns.items():
+        path = os.path.join(out_dir, f'{name}.csv')
+        if os.path.exists(path):
+            outputs[name] = pd.read_csv(path, encoding='utf-8-sig', dtype={'고객명': str, '매출년월': str, '상품': str})
+        else:
+            outputs[name] = pd.DataFrame(columns=cols)
+    return outputs
+
+
+def merge_outputs(existing, delta, periods):
+    """기존 요약에서 해당 매출년월을 새 데이터로 교체하고, 영향받는 연도만 연간 합계를 다시 계산합니다."""
+    periods = set(periods)
+    merged = {}
+    for name, sort_keys in [(storage.MONTHLY_SUMMARY, ['고객명', '매출년월']),
+                            (storage.COMMERCIAL_SUMMARY, ['고객명', '매출년월', '상품'])]:
+        kept = existing[name][~existing[name]['매출년월'].isin(periods)]
+        merged[name] = pd.concat([kept, delta[name]]).sort_values(sort_keys).reset_index(drop=True)
+
+    monthly = merged[storage.MONTHLY_SUMMARY]
+    years = {int(p[:4]) for p in periods}
+    recomputed = yearly_from_monthly(monthly[monthly['매출년월'].str[:4].astype(int).isin(years)])
+    yearly = existing[storage.YEARLY_SUMMARY]
+    yearly = pd.concat([yearly[~yearly['매출년도'].isin(years)], recomputed])
+    merged[storage.YEARLY_SUMMARY] = yearly.sort_values(['고객명', '매출년도']).reset_index(drop=True)
+
+    return {name: merged[name] for name in existing}
+
+
+def load_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {'periods': {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, out_dir):
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def record_periods(manifest, summary, source):
+    ingested_at = datetime.now().isoformat(timespec='seconds')
+    for period, rows in summary.groupby('매출년월').size().items():
+        manifest['periods'][period] = {'source': os.path.basename(source), 'rows': int(rows), 'ingested_at': ingested_at}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="output_v2.csv 원본에서 대시보드용 요약 파일을 생성합니다.")
+    parser.add_argument('input', help="원본 추출 파일 경로 (output_v2.csv)")
+    parser.add_argument('--out', default='data', help="요약 파일 저장 폴더 (기본값: data)")
+    parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--block-mb', type=int, default=DEFAULT_BLOCK_SIZE // (1024 * 1024),
+                        help="작업 단위 바이트 구간 크기 (MB)")
+    parser.add_argument('--encoding', default='utf-8', help="원본 파일 인코딩")
+    parser.add_argument('--commercial-keyword', default=COMMERCIAL_KEYWORD,
+                        help="업무용 요약에 포함할 상품명 키워드")
+    parser.add_argument('--incremental', action='store_true',
+                        help="입력 파일의 매출년월만 기존 요약에 병합합니다")
+    parser.add_argument('--replace', action='store_true',
+                        help="증분 모드에서 이미 반영된 매출년월도 새 데이터로 교체합니다")
+    args = parser.parse_args(argv)
+
+    print("🚀 데이터 요약 및 정제 작업을 시작합니다...")
+    started = time.perf_counter()
+    summary = summarize_raw(args.input, args.workers, args.block_mb * 1024 * 1024, args.encoding)
+
+    if args.incremental:
+        manifest = load_manifest(args.out)
+        if not args.replace:
+            skipped = sorted(set(summary['매출년월']) & set(manifest['periods']))
+            if skipped:
+                print(f"⏭️ 이미 반영된 매출년월은 건너뜁니다: {', '.join(skipped)}")
+            summary = summary[~summary['매출년월'].isin(skipped)]
+        if summary.empty:
+            print("✅ 새로 반영할 데이터가 없습니다.")
+            return
+        periods = sorted(summary['매출년월'].unique())
+        delta, dimension = build_outputs(summary, args.commercial_keyword, storage.read_customers(args.out))
+        outputs = merge_outputs(read_outputs(args.out), delta, periods)
+        years = sorted({int(p[:4]) for p in periods})
+        print(f"🔄 반영 매출년월: {', '.join(periods)}")
+    else:
+        manifest = {'periods': {}}
+        outputs, dimension = build_outputs(summary, args.commercial_keyword)
+        years = None
+
+    write_outputs(outputs, dimension, args.out, years)
+    record_periods(manifest, summary, args.input)
+    save_manifest(manifest, args.out)
+
+    for name, frame in outputs.items():
+        print(f"📊 {name}: {len(frame):,}행")
+    print(f"✅ 작업 완료! ({time.perf_counter() - started:,.1f}초)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""크기가 정해진 LRU 캐시와 백그라운드 선계산.
+
+사용자가 다음에 요청할 가능성이 큰 키(이웃 연도, 다른 지표 등)를 스레드 풀에서 미리
+계산해 캐시에 넣어 둡니다. 캐시가 가득 차면 가장 오래 쓰이지 않은 항목부터 버립니다.
+선계산 중인 키를 요청하면 같은 계산을 다시 하지 않고 끝나기를 기다립니다.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+_MISSING = object()
+
+
+class LRUCache:
+    """스레드 안전한 LRU 캐시."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+class Prefetcher:
+    """compute(key) 결과를 LRU 캐시에 두고, 예상 키를 백그라운드에서 미리 계산합니다."""
+
+    def __init__(self, compute, maxsize=32, workers=2):
+        self.compute = compute
+        self.cache = LRUCache(maxsize)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch')
+
+    def get(self, key):
+        """캐시된 값을 반환하고, 없으면 (선계산 중이면 기다렸다가) 계산합니다."""
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            return future.result()
+
+        value = self.compute(key)
+        self.cache.put(key, value)
+        return value
+
+    def prefetch(self, keys):
+        """캐시에 없고 계산 중이 아닌 키만 스레드 풀에 넣습니다."""
+        for key in keys:
+            with self._lock:
+                if key in self._pending or key in self.cache:
+                    continue
+                self._pending[key] = self._pool.submit(self._run, key)
+
+    def _run(self, key):
+        try:
+            value = self.compute(key)
+            self.cache.put(key, value)
+            return value
+        finally:
+            # prefetch()가 _pending에 등록을 마친 뒤에 제거되도록 같은 잠금 사용
+            with self._lock:
+                self._pending.pop(key, None)
@@ -0,0 +1,150 @@
+"""페이지 실행(rerun) 단계별 시간·데이터 크기 측정과 JSONL 기록.
+
+RunProfile 하나가 페이지 스크립트 한 번 실행에 해당하며, 단계마다 걸린 시간과 함께
+DataFrame 행 수·메모리 크기, HTML·그림(JSON) 전송 크기를 기록합니다. 크기 계산은
+측정이 켜져 있을 때만 합니다.
+
+기록 파일은 실행 한 번당 한 줄의 JSON이며, summarize_log()로 페이지·단계별 p50/p95를
+계산합니다.
+
+사용 예 (기록 요약):
+    python -m analytics.profiling logs/profile.jsonl
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+def payload_size(obj):
+    """(행 수, 바이트 수). DataFrame은 메모리 크기, 문자열은 UTF-8 크기, 그림은 JSON 크기."""
+    if isinstance(obj, pd.DataFrame):
+        return len(obj), int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return len(obj), int(obj.memory_usage(deep=True))
+    if isinstance(obj, str):
+        return None, len(obj.encode('utf-8'))
+    if isinstance(obj, bytes):
+        return None, len(obj)
+    if hasattr(obj, 'to_plotly_json'):
+        from analytics.charts import figure_payload_size
+        return None, figure_payload_size(obj)
+    return None, None
+
+
+class Stage:
+    """단계 하나의 측정값."""
+
+    def __init__(self, name, enabled):
+        self.name = name
+        self.enabled = enabled
+        self.seconds = 0.0
+        self.rows = None
+        self.nbytes = None
+
+    def measure(self, obj):
+        """단계 결과물의 크기를 기록합니다 (여러 번 호출하면 합산)."""
+        if not self.enabled:
+            return obj
+        rows, nbytes = payload_size(obj)
+        if rows is not None:
+            self.rows = (self.rows or 0) + rows
+        if nbytes is not None:
+            self.nbytes = (self.nbytes or 0) + nbytes
+        return obj
+
+    def to_dict(self):
+        return {'stage': self.name, 'seconds': self.seconds, 'rows': self.rows, 'bytes': self.nbytes}
+
+
+class RunProfile:
+    """페이지 실행 한 번의 단계별 측정."""
+
+    def __init__(self, page, enabled=True):
+        self.page = page
+        self.enabled = enabled
+        self.stages = []
+        self.started = time.perf_counter()
+        self.total_seconds = None
+
+    @contextmanager
+    def stage(self, name):
+        current = Stage(name, self.enabled)
+        started = time.perf_counter()
+        try:
+            yield current
+        finally:
+            current.seconds = time.perf_counter() - started
+            self.stages.append(current)
+
+    def finish(self):
+        self.total_seconds = time.perf_counter() - self.started
+        return self
+
+    def table(self):
+        """단계별 측정값 DataFrame (마지막 행은 전체 실행 시간)."""
+        rows = [stage.to_dict() for stage in self.stages]
+        rows.append({'stage': 'total', 'seconds': self.total_seconds, 'rows': None, 'bytes': None})
+        return pd.DataFrame(rows).set_index('stage').astype('float64')
+
+    def to_record(self):
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'page': self.page,
+            'total_seconds': self.total_seconds,
+            'stages': [stage.to_dict() for stage in self.stages],
+        }
+
+
+def append_log(path, profile):
+    """실행 기록 한 줄을 JSONL 파일에 추가합니다."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(profile.to_record(), ensure_ascii=False) + '\n')
+
+
+def read_log(path):
+    """JSONL 기록을 (page, stage, seconds, rows, bytes) 긴 형식 DataFrame으로 읽습니다."""
+    rows = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            rows.append({'page': record['page'], 'stage': 'total', 'seconds': record['total_seconds'],
+                         'rows': None, 'bytes': None})
+            rows.extend({'page': record['page'], **stage} for stage in record['stages'])
+    return pd.DataFrame(rows, columns=['page', 'stage', 'seconds', 'rows', 'bytes'])
+
+
+def summarize_log(path):
+    """페이지·단계별 실행 횟수, 시간 p50/p95(ms), 전송 크기 p50/p95(KB)."""
+    log = read_log(path)
+    grouped = log.groupby(['page', 'stage'], sort=False)
+
+    def quantiles(values, scale):
+        values = values.dropna().to_numpy(dtype=np.float64)
+        if not len(values):
+            return np.nan, np.nan
+        p50, p95 = np.percentile(values, [50, 95])
+        return p50 * scale, p95 * scale
+
+    rows = []
+    for (page, stage), group in grouped:
+        ms50, ms95 = quantiles(group['seconds'], 1000)
+        kb50, kb95 = quantiles(group['bytes'], 1 / 1024)
+        rows.append({'page': page, 'stage': stage, 'runs': len(group),
+                     'p50_ms': ms50, 'p95_ms': ms95, 'p50_kb': kb50, 'p95_kb': kb95})
+    return pd.DataFrame(rows).set_index(['page', 'stage'])
+
+
+if __name__ == '__main__':
+    pd.set_option('display.width', 200)
+    print(summarize_log(sys.argv[1]).round(1).to_string())
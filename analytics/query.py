@@ -0,0 +1,175 @@
+"""원본 추출 파일(output_v2.csv 또는 같은 열의 Parquet)을 직접 조회하는 SQL 백엔드 (선택 기능).
+
+DuckDB가 설치되어 있을 때만 사용할 수 있습니다 (pip install duckdb).
+연도·상품 조건은 WHERE로, 최소 합계는 HAVING으로, 기간별 TOP N은 창 함수로 엔진 안에서
+처리하므로 원본 전체를 pandas로 읽지 않고 필요한 집계 결과만 받아옵니다.
+고객명 변형은 데이터 폴더의 고객 차원 테이블(customer_dim)로 요약과 같은 대표 고객명에
+합쳐 집계합니다. 차원 테이블에 없는 고객은 파이프라인과 같은 규칙(매칭키, 사용량 가중치)으로
+대표 고객명을 정합니다.
+
+사용 예:
+    python -m analytics.query D:/project2/data/output_v2.csv --period 분기 --years 2024 2024 --product 업무난방용
+    python -m analytics.query D:/project2/data/output_v2.csv --to-parquet D:/project2/data/output_v2.parquet
+"""
+import argparse
+
+import pandas as pd
+
+from analytics import customers, storage
+
+try:
+    import duckdb
+except ImportError:  # 선택 의존성
+    duckdb = None
+
+# 지표 → 원본 열 (pipeline.RAW_MEASURES와 같은 대응)
+METRIC_COLUMNS = {'사용량': '"사용량(m3)"', '사용열량': '"사용량(mj)"'}
+
+# 기간 단위 → 기간 라벨 SQL
+PERIODS = {
+    '연도': "CAST(매출년도 AS VARCHAR)",
+    '분기': "printf('%d-Q%d', 매출년도, (월 - 1) // 3 + 1)",
+    '월': "printf('%d-%02d', 매출년도, 월)",
+}
+
+RAW_TYPES = "{'상품명': 'VARCHAR', '고객명': 'VARCHAR', '매출년월': 'VARCHAR'}"
+
+
+def available():
+    """DuckDB 백엔드를 쓸 수 있는지 여부."""
+    return duckdb is not None
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class RawQuery:
+    """원본 추출 파일 하나에 대한 조회 엔진.
+
+    인메모리 데이터베이스에 원본 뷰와 고객명 대응표만 두고, 조회마다 별도 커서를 열어
+    여러 스레드(세션)에서 동시에 호출할 수 있습니다.
+    """
+
+    def __init__(self, source, encoding='utf-8', data_dir=storage.DATA_DIR):
+        if duckdb is None:
+            raise ImportError("원본 직접 조회에는 DuckDB가 필요합니다: pip install duckdb")
+        self.source = source
+        self.connection = duckdb.connect()
+        if source.lower().endswith('.parquet'):
+            scan = f"read_parquet({_literal(source)})"
+        else:
+            scan = f"read_csv({_literal(source)}, header=true, encoding={_literal(encoding)}, types={RAW_TYPES})"
+        # 매출년월 표기('2020-01', '2020-01-01', '202001')를 정수 연도·월로 통일
+        self.connection.execute(f"""
+            CREATE VIEW raw AS
+            SELECT 상품명, 고객명,
+                   CAST(substr(digits, 1, 4) AS SMALLINT) AS 매출년도,
+                   CAST(substr(digits, 5, 2) AS TINYINT) AS 월,
+                   "사용량(m3)", "사용량(mj)"
+            FROM (SELECT *, regexp_replace(CAST(매출년월 AS VARCHAR), '[^0-9]', '', 'g') AS digits FROM {scan})
+        """)
+        # 고유 고객명별 사용량(작은 표)만 가져와 대표 고객명 대응표를 만든 뒤 엔진 안에 저장
+        # 기존 고객 차원 테이블을 기준으로 삼아 요약·보고서와 같은 대표 고객명을 씀
+        names = self.connection.execute(
+            'SELECT 고객명, sum("사용량(m3)") AS 사용량 FROM raw WHERE 고객명 IS NOT NULL GROUP BY 고객명'
+        ).df()
+        dimension = customers.build_dimension(names['고객명'], names['사용량'].fillna(0),
+                                              existing=storage.read_customers(data_dir))
+        mapping = pd.DataFrame({'고객명': names['고객명'].to_numpy(),
+                                '대표고객명': customers.canonical_names(names['고객명'], dimension)})
+        self.connection.register('mapping_frame', mapping)
+        self.connection.execute("CREATE TABLE customer_map AS SELECT * FROM mapping_frame")
+        self.connection.unregister('mapping_frame')
+
+    def _execute(self, sql, params=None):
+        return self.connection.cursor().execute(sql, params or []).df()
+
+    def products(self):
+        """원본의 상품명 목록."""
+        return self._execute("SELECT DISTINCT 상품명 FROM raw ORDER BY 상품명")['상품명'].tolist()
+
+    def _where(self, year_from, year_to, products, customer_names=None):
+        clauses, params = [], []
+        if year_from is not None:
+            clauses.append("매출년도 >= ?")
+            params.append(int(year_from))
+        if year_to is not None:
+            clauses.append("매출년도 <= ?")
+            params.append(int(year_to))
+        if products:
+            clauses.append(f"상품명 IN ({', '.join('?' * len(products))})")
+            params.extend(products)
+        if customer_names:
+            clauses.append(f"m.대표고객명 IN ({', '.join('?' * len(customer_names))})")
+            params.extend(customer_names)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def top_customers(self, metric, period='연도', year_from=None, year_to=None, products=None,
+                      min_total=0, top_n=20):
+        """기간별 TOP N (기간, 순위, 고객명, 지표). min_total은 기간 합계 기준(기준 단위)입니다."""
+        where, params = self._where(year_from, year_to, products)
+        sql = f"""
+            SELECT 기간, rank() OVER (PARTITION BY 기간 ORDER BY 값 DESC) AS 순위, 고객명, 값 AS "{metric}"
+            FROM (
+                SELECT {PERIODS[period]} AS 기간, m.대표고객명 AS 고객명, sum({METRIC_COLUMNS[metric]}) AS 값
+                FROM raw JOIN customer_map m USING (고객명)
+                {where}
+                GROUP BY ALL
+                HAVING sum({METRIC_COLUMNS[metric]}) >= ?
+            )
+            QUALIFY 순위 <= ?
+            ORDER BY 기간, 순위, 고객명
+        """
+        return self._execute(sql, [*params, float(min_total), int(top_n)])
+
+    def customer_series(self, customer_names, metric, period='월', year_from=None, year_to=None, products=None):
+        """지정한 고객(대표 고객명)들의 기간별 합계 (고객명, 기간, 지표)."""
+        if not customer_names:
+            return pd.DataFrame(columns=['고객명', '기간', metric])
+        where, params = self._where(year_from, year_to, products, list(customer_names))
+        sql = f"""
+            SELECT m.대표고객명 AS 고객명, {PERIODS[period]} AS 기간, sum({METRIC_COLUMNS[metric]}) AS "{metric}"
+            FROM raw JOIN customer_map m USING (고객명)
+            {where}
+            GROUP BY ALL
+            ORDER BY 고객명, 기간
+        """
+        return self._execute(sql, params)
+
+    def to_parquet(self, path):
+        """원본 CSV를 같은 열 구성의 Parquet으로 저장합니다 (이후 조회는 Parquet을 원본으로 사용)."""
+        self.connection.cursor().execute(f"""
+            COPY (SELECT 상품명, 고객명, printf('%d-%02d', 매출년도, 월) AS 매출년월, "사용량(m3)", "사용량(mj)" FROM raw)
+            TO {_literal(path)} (FORMAT parquet)
+        """)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="원본 추출 파일 직접 조회 (DuckDB)")
+    parser.add_argument('source', help="원본 CSV 또는 Parquet 경로")
+    parser.add_argument('--metric', choices=list(METRIC_COLUMNS), default='사용량')
+    parser.add_argument('--period', choices=list(PERIODS), default='연도')
+    parser.add_argument('--years', type=int, nargs=2, metavar=('FROM', 'TO'))
+    parser.add_argument('--product', action='append', help="상품명 (여러 번 지정 가능)")
+    parser.add_argument('--min-total', type=float, default=0, help="기간 합계 하한 (기준 단위)")
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--encoding', default='utf-8')
+    parser.add_argument('--data-dir', default=storage.DATA_DIR, help="고객 차원 테이블이 있는 데이터 폴더")
+    parser.add_argument('--to-parquet', help="조회 대신 원본을 이 경로의 Parquet으로 변환")
+    args = parser.parse_args(argv)
+
+    engine = RawQuery(args.source, args.encoding, args.data_dir)
+    if args.to_parquet:
+        engine.to_parquet(args.to_parquet)
+        print(f"✅ {args.to_parquet} 저장 완료")
+        return
+
+    year_from, year_to = args.years or (None, None)
+    result = engine.top_customers(args.metric, args.period, year_from, year_to, args.product,
+                                  args.min_total, args.top)
+    print(result.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
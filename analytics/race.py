@@ -0,0 +1,141 @@
+"""막대 레이스(순위 변동 애니메이션) 데이터와 Plotly 그림 생성.
+
+레이스 데이터는 기간별 TOP N을 한 번의 정렬·그룹 연산으로 뽑은 긴 형식 DataFrame
+(기간, 고객명, 값)입니다. 집계와 순위 계산은 고객ID로 하고, 고객명은 뽑힌 TOP N 행에만
+붙입니다. 월별 모드는 고객×월 행렬의 누적합으로 최근 12개월 합계를
+한꺼번에 계산합니다.
+
+애니메이션 프레임에는 trace 종류(bar), 막대 값(x), 고객명(y), 색상과 y축 카테고리 순서만 담고,
+막대 방향·텍스트 형식 등 나머지 속성은 기본 trace에 한 번만 정의합니다.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+PALETTE = px.colors.qualitative.Plotly
+
+
+def color_map(customers):
+    """업체별 고유 색상 (레이스 중 업체 식별을 위해 고정)."""
+    return {customer: PALETTE[i % len(PALETTE)] for i, customer in enumerate(customers)}
+
+
+def yearly_race(df, metric, top_n, names):
+    """연도별 TOP N을 (기간, 값 오름차순)으로 정렬해 반환합니다. names는 고객ID → 고객명."""
+    ranked = df[['매출년도', '고객ID', metric]].sort_values(
+        ['매출년도', metric], ascending=[True, False], kind='stable'
+    )
+    top = ranked.groupby('매출년도', sort=False).head(top_n)
+    top = top.iloc[::-1].sort_values('매출년도', kind='stable')
+    return pd.DataFrame({
+        '기간': top['매출년도'].astype(str).to_numpy(),
+        '고객명': names.reindex(top['고객ID']).to_numpy(),
+        '값': top[metric].to_numpy(dtype=np.float64),
+    })
+
+
+def rolling_race(monthly, metric, top_n, names, window=12):
+    """월별 요약에서 최근 window개월 합계 기준 월별 TOP N을 반환합니다.
+
+    첫 window개월이 모두 쌓인 달부터 프레임을 만듭니다.
+    """
+    first_year = int(monthly['매출년도'].min())
+    periods = (monthly['매출년도'].to_numpy(dtype=np.int64) - first_year) * 12 + monthly['월'].to_numpy(dtype=np.int64) - 1
+    n_periods = int(periods.max()) + 1
+    codes, customers = pd.factorize(monthly['고객ID'])
+
+    values = np.bincount(codes * n_periods + periods, weights=monthly[metric].to_numpy(dtype=np.float64),
+                         minlength=len(customers) * n_periods).reshape(len(customers), n_periods)
+    cumulative = np.cumsum(values, axis=1)
+    rolling = cumulative[:, window - 1:].copy()
+    rolling[:, 1:] -= cumulative[:, :-window]
+
+    k = min(top_n, len(customers))
+    top_idx = np.argpartition(-rolling, k - 1, axis=0)[:k]
+    top_vals = np.take_along_axis(rolling, top_idx, axis=0)
+    order = np.argsort(top_vals, axis=0, kind='stable')
+    top_idx = np.take_along_axis(top_idx, order, axis=0)
+    top_vals = np.take_along_axis(top_vals, order, axis=0)
+
+    period_numbers = np.arange(window - 1, n_periods)
+    labels = [f'{first_year + p // 12}-{p % 12 + 1:02d}' for p in period_numbers]
+    race = pd.DataFrame({
+        '기간': np.repeat(labels, k),
+        '고객명': names.reindex(np.asarray(customers)[top_idx.T.ravel()]).to_numpy(),
+        '값': top_vals.T.ravel(),
+    })
+    return race[race['값'] > 0].reset_index(drop=True)
+
+
+def race_figure(race, colors, title, axis_title, frame_ms=1500, transition_ms=1200, slider_prefix="분석 연도: "):
+    """기간순으로 정렬된 레이스 데이터로 애니메이션 막대 그래프를 만듭니다."""
+    # 레이스 데이터는 기간순으로 정렬되어 있으므로 기간별 구간을 이진 탐색으로 찾음
+    period_values = race['기간'].to_numpy()
+    periods = pd.unique(period_values)
+    starts = np.searchsorted(period_values, periods, side='left')
+    ends = np.searchsorted(period_values, periods, side='right')
+
+    frames = []
+    for period, start, end in zip(periods, starts, ends):
+        period_data = race.iloc[start:end]
+        names = period_data['고객명'].tolist()
+        frames.append({
+            'name': str(period),
+            'data': [{
+                # trace 종류를 빼면 plotly가 scatter로 채워 재생 시 막대가 점 그래프로 바뀜
+                'type': 'bar',
+                'x': np.round(period_data['값'].to_numpy()).tolist(),
+                'y': names,
+                'marker': {'color': [colors[c] for c in names]},
+            }],
+            # 💡 매 프레임마다 y축 카테고리 순서를 해당 기간 순위로 강제 재정렬
+            'layout': {'yaxis': {'categoryarray': names}},
+        })
+
+    initial = frames[0]['data'][0] if frames else {'x': [], 'y': [], 'marker': {'color': []}}
+    x_max = race['값'].max() * 1.1 if len(race) else 1
+
+    return go.Figure(
+        data=[go.Bar(
+            x=initial['x'],
+            y=initial['y'],
+            orientation='h',
+            texttemplate=' %{x:,.0f}',
+            textposition='outside',
+            marker=initial['marker'],
+            cliponaxis=False
+        )],
+        layout=go.Layout(
+            height=700,
+            xaxis=dict(range=[0, x_max], autorange=False, title=axis_title, tickformat=",.0f"),
+            yaxis=dict(title="", showticklabels=True, automargin=True,
+                       categoryarray=initial['y'], categoryorder="array"),
+            title=title,
+            template="plotly_white",
+            margin=dict(l=200, r=100, t=100, b=50),
+            updatemenus=[{
+                "buttons": [
+                    {
+                        "args": [None, {"frame": {"duration": frame_ms, "redraw": True}, "fromcurrent": True, "transition": {"duration": transition_ms, "easing": "quad-in-out"}}],
+                        "label": "▶️ 재생", "method": "animate"
+                    },
+                    {
+                        "args": [[None], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}],
+                        "label": "⏸️ 일시정지", "method": "animate"
+                    }
+                ],
+                "direction": "left", "pad": {"r": 10, "t": 87}, "showactive": False, "type": "buttons", "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top"
+            }],
+            sliders=[{
+                "active": 0,
+                "yanchor": "top", "xanchor": "left",
+                "currentvalue": {"font": {"size": 20}, "prefix": slider_prefix, "visible": True, "xanchor": "right"},
+                "transition": {"duration": transition_ms, "easing": "quad-in-out"},
+                "pad": {"b": 10, "t": 50}, "len": 0.9, "x": 0.1, "y": 0,
+                "steps": [{"args": [[f['name']], {"frame": {"duration": frame_ms, "redraw": True}, "mode": "immediate", "transition": {"duration": transition_ms}}],
+                           "label": f['name'], "method": "animate"} for f in frames]
+            }]
+        ),
+        frames=frames
+    )
@@ -0,0 +1,121 @@
+"""연도별 순위 인덱스.
+
+로드 시점에 지표(사용량, 사용열량)별로 한 번만 만들어 두고, 슬라이더 조작 시에는
+정렬된 배열을 잘라 쓰는 방식으로 TOP N 선택, 순위표, 선 끝 표시 위치를 구합니다.
+순위는 연도 안에서만 매기므로 연도 범위 필터나 단위 변환(배율)과 무관합니다.
+인덱스는 정수 고객ID로만 정렬·조회하고, 고객명은 화면에 표시할 행에만 붙입니다.
+"""
+import numpy as np
+import pandas as pd
+
+from analytics import units
+from analytics.customers import attach_names
+
+METRICS = ["사용량", "사용열량"]
+
+
+class RankIndex:
+    """한 지표에 대한 연도별 순위 인덱스.
+
+    - by_year: (매출년도, 순위) 순으로 정렬된 행. 연도별 구간은 year_bounds로 찾습니다.
+    - by_customer: 고객ID 인덱스, (고객ID, 매출년도) 순 정렬. 고객별 연도 이력 조회용.
+    - trajectory: 고객별 최초/최종 등장 연도와 최고 순위.
+    - names: 고객ID → 고객명 Series (표시용).
+    """
+
+    def __init__(self, df, metric, names):
+        ranked = df[['고객ID', '매출년도', metric]].copy()
+        ranked['순위'] = ranked.groupby('매출년도')[metric].rank(ascending=False, method='min').astype(int)
+        ranked = ranked.sort_values(['매출년도', '순위', '고객ID'], kind='stable').reset_index(drop=True)
+
+        # 직전 등장 연도 대비 순위 변동 (양수 = 상승)
+        by_customer = ranked.sort_values(['고객ID', '매출년도'], kind='stable')
+        ranked['순위변동'] = -by_customer.groupby('고객ID')['순위'].diff()
+
+        self.metric = metric
+        self.names = names
+        self.by_year = ranked
+        years = ranked['매출년도'].to_numpy()
+        self.years = np.unique(years)
+        starts = np.searchsorted(years, self.years, side='left')
+        ends = np.searchsorted(years, self.years, side='right')
+        self.year_bounds = {int(y): (int(s), int(e)) for y, s, e in zip(self.years, starts, ends)}
+        self.by_customer = ranked.sort_values(['고객ID', '매출년도'], kind='stable').set_index('고객ID')
+        self.trajectory = self.by_customer.groupby(level='고객ID').agg(
+            진입연도=('매출년도', 'min'), 최종연도=('매출년도', 'max'), 최고순위=('순위', 'min')
+        )
+
+    def year_slice(self, year, top_n=None):
+        """해당 연도의 행을 순위순으로 반환합니다. top_n을 주면 순위 top_n 이하(동순위 포함)까지만."""
+        start, end = self.year_bounds.get(int(year), (0, 0))
+        if top_n is not None:
+            ranks = self.by_year['순위'].to_numpy()[start:end]
+            end = start + int(np.searchsorted(ranks, top_n, side='right'))
+        return self.by_year.iloc[start:end]
+
+    def top_n(self, years, top_n):
+        """여러 연도의 TOP N 행을 (매출년도, 순위) 순으로 반환합니다."""
+        return pd.concat([self.year_slice(y, top_n) for y in years])
+
+    def customer_rows(self, customers, year_from, year_to):
+        """지정 고객ID들의 연도 범위 내 행을 (고객, 매출년도) 순으로 반환합니다."""
+        rows = self.by_customer.loc[list(customers)]
+        rows = rows[(rows['매출년도'] >= year_from) & (rows['매출년도'] <= year_to)]
+        return rows.reset_index()
+
+    def rank_movers(self, year_from, year_to, n=10):
+        """두 연도 모두 순위가 있는 고객 중 순위가 가장 많이 오른/내린 고객을 반환합니다.
+
+        판매량이 0 이하인 연도(해지·휴면 고객)는 모두 최하위 동순위가 되므로 비교에서 뺍니다.
+        """
+        start = self.year_slice(year_from)
+        end = self.year_slice(year_to)
+        start = start[start[self.metric] > 0].set_index('고객ID')['순위']
+        end = end[end[self.metric] > 0].set_index('고객ID')[['순위', self.metric]]
+        moved = end.join(start.rename('기준순위'), how='inner')
+        moved['순위변동'] = moved['기준순위'] - moved['순위']
+        moved = moved[['기준순위', '순위', '순위변동', self.metric]]
+        risers = moved[moved['순위변동'] > 0].nlargest(n, '순위변동')
+        fallers = moved[moved['순위변동'] < 0].nsmallest(n, '순위변동')
+        return [movers.set_axis(self.names.reindex(movers.index).to_numpy()).rename_axis('고객명')
+                for movers in (risers, fallers)]
+
+
+def last_points(rows):
+    """(고객, 매출년도) 순으로 정렬된 행에서 고객별 마지막 연도 행만 남깁니다."""
+    return rows.drop_duplicates('고객ID', keep='last')
+
+
+def build_rank_indexes(df, names):
+    """지표별 RankIndex를 만듭니다. names는 고객ID → 고객명 Series."""
+    return {metric: RankIndex(df, metric, names) for metric in METRICS}
+
+
+def rank_table(index, year_from, year_to, top_n, unit_option):
+    """연도 범위의 연도별 TOP N 행 (표시 단위, '고객명\n(값)' 표시텍스트 포함)."""
+    years = [y for y in index.years.tolist() if year_from <= y <= year_to]
+    table = attach_names(index.top_n(years, top_n), index.names)
+    table[index.metric] = units.from_base(table[index.metric], unit_option)
+    table['표시텍스트'] = table['고객명'] + "\n(" + table[index.metric].map("{:,.0f}".format) + ")"
+    return table
+
+
+def rank_pivot(table):
+    """순위 × 연도 표시텍스트 표."""
+    return table.pivot(index='순위', columns='매출년도', values='표시텍스트').fillna("-").sort_index()
+
+
+def trend_rows(index, year_from, year_to, top_n, unit_option):
+    """마지막 연도 TOP N 고객의 연도 범위 내 행 (표시 단위, 고객 순위순 → 연도순)."""
+    customers = index.year_slice(year_to, top_n)['고객ID'].tolist()
+    rows = attach_names(index.customer_rows(customers, year_from, year_to), index.names)
+    rows[index.metric] = units.from_base(rows[index.metric], unit_option)
+    return rows
+
+
+def customer_pivot(rows, metric):
+    """고객 × 연도 합계 표 (총계 행·열 포함, 총계 내림차순)."""
+    return rows.pivot_table(
+        index='고객명', columns='매출년도', values=metric, aggfunc='sum', observed=True,
+        margins=True, margins_name="총계"
+    ).fillna(0).sort_values('총계', ascending=False)
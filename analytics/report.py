@@ -0,0 +1,68 @@
+"""월별 순위 보고서 HTML 표 렌더러.
+
+숫자는 열 전체를 한 번에 문자열로 만들고, 행 문자열은 목록으로 모아 마지막에 한 번만
+join 합니다. 표시할 행 구간(window)만 HTML로 만들 수 있으며, 선택범위 합계 행은
+호출하는 쪽에서 전체 범위 기준으로 계산해 넘깁니다.
+"""
+from html import escape
+
+import numpy as np
+
+from analytics.matrix import MONTHS
+
+TOTAL_LABEL = "선택범위 합계"
+# 월 열 표시 이름 (HTML 표와 내려받기 파일 공용)
+MONTH_LABELS = {m: f'{m:02d}월' for m in MONTHS}
+
+HEADER_HTML = (
+    '<table class="report-table"><thead><tr><th>순위</th><th>고객명</th>'
+    + ''.join(f'<th>{label}</th>' for label in MONTH_LABELS.values())
+    + '<th>연간 합계</th></tr></thead><tbody>'
+)
+
+
+def report_styles(font_size):
+    return f"""
+        <style>
+            .report-header {{ text-align: center; color: black; }}
+            .report-table {{ width: 100%; border-collapse: collapse; font-size: {font_size}px; margin-top: 20px; }}
+            .report-table th {{ background-color: #2c3e50; color: white; padding: 12px; border: 1px solid #ddd; text-align: center; }}
+            .report-table td {{ padding: 10px; border: 1px solid #ddd; text-align: right; }}
+            .rank-col {{ text-align: center !important; background-color: #f8f9fa; font-weight: bold; width: 60px; }}
+            .name-col {{ text-align: left !important; font-weight: bold; min-width: 180px; }}
+            .total-row {{ background-color: #f1c40f !important; font-weight: bold; }}
+        </style>
+        """
+
+
+def format_numbers(values):
+    """숫자 배열을 천 단위 구분 기호가 있는 정수 문자열 배열로 변환합니다."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.array([f'{v:,.0f}' for v in values.ravel().tolist()], dtype=object).reshape(values.shape)
+
+
+def _value_cells(values):
+    cells = format_numbers(values)
+    return ['<td>' + '</td><td>'.join(row) + '</td>' for row in cells.tolist()]
+
+
+def render_table(report, total=None):
+    """보고서 DataFrame(index=고객명, 열=순위·1~12월·연간 합계)을 HTML 표로 만듭니다.
+
+    total에는 선택범위 합계(1~12월, 연간 합계)를 넘기면 마지막 행으로 표시합니다.
+    """
+    value_cols = [*MONTHS, '연간 합계']
+    ranks = report['순위'].astype(str).tolist()
+    names = [escape(str(name)) for name in report.index]
+    cells = _value_cells(report.reindex(columns=value_cols, fill_value=0).to_numpy())
+
+    parts = [HEADER_HTML]
+    parts.extend(
+        f'<tr><td class="rank-col">{rank}</td><td class="name-col">{name}</td>{row}</tr>'
+        for rank, name, row in zip(ranks, names, cells)
+    )
+    if total is not None:
+        total_cells = _value_cells([total.reindex(value_cols, fill_value=0).to_numpy()])[0]
+        parts.append(f'<tr class="total-row"><td class="rank-col">-</td><td class="name-col">{TOTAL_LABEL}</td>{total_cells}</tr>')
+    parts.append('</tbody></table>')
+    return ''.join(parts)
@@ -0,0 +1,241 @@
+"""요약 데이터의 컬럼형(Parquet) 저장 및 로드.
+
+Parquet 파일에는 다음과 같은 형식으로 저장합니다.
+- 고객ID: int32 (고객명은 고객 차원 테이블 customer_dim에만 저장)
+- 상품: 사전(dictionary) 인코딩 (pandas category)
+- 매출년도: int16, 월: int8 (매출년월 문자열은 저장하지 않음)
+- 사용량, 사용열량: float64
+
+월별 요약은 Hive 방식(열=값 폴더)으로 나눠 저장합니다. 예: industry_monthly_summary/매출년도=2024/
+(업무용은 상품=.../매출년도=... 두 단계). 로더에 연도·상품을 지정하면 해당 폴더만 읽고,
+연도·상품 목록은 파일 내용을 읽지 않고 폴더 이름에서 얻습니다.
+
+CSV 파일은 사람이 읽는 교환 형식으로 대표 고객명을 그대로 씁니다.
+로더는 분할 폴더 → Parquet 파일 → 같은 이름의 CSV 순서로 찾아 동일한 형식으로 변환합니다.
+
+사용 예 (기존 CSV를 Parquet과 고객 차원 테이블로 변환):
+    python -m analytics.storage data
+"""
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from analytics import customers
+
+DATA_DIR = 'data'
+
+YEARLY_SUMMARY = 'industry_yearly_summary'
+MONTHLY_SUMMARY = 'industry_monthly_summary'
+COMMERCIAL_SUMMARY = 'commercial_heating_monthly_summary'
+SUMMARIES = [YEARLY_SUMMARY, MONTHLY_SUMMARY, COMMERCIAL_SUMMARY]
+CUSTOMER_DIM = 'customer_dim'
+
+# 분할 저장하는 요약과 분할 열 (폴더 순서)
+PARTITIONS = {
+    MONTHLY_SUMMARY: ['매출년도'],
+    COMMERCIAL_SUMMARY: ['상품', '매출년도'],
+}
+PARTITION_TYPES = {'상품': pa.string(), '매출년도': pa.int16()}
+
+CATEGORY_COLUMNS = ['상품']
+MEASURE_COLUMNS = ['사용량', '사용열량']
+COLUMN_ORDER = ['고객ID', '상품', '매출년도', '월', '사용량', '사용열량']
+
+
+def to_columnar(frame, dimension):
+    """CSV 형식의 요약 DataFrame을 저장용 타입으로 변환합니다 (고객명 → 고객ID)."""
+    out = frame.copy()
+    if '매출년월' in out.columns:
+        period = out.pop('매출년월').astype(str)
+        out['매출년도'] = period.str[:4].astype('int16')
+        out['월'] = period.str[5:7].astype('int8')
+    if '매출년도' in out.columns:
+        out['매출년도'] = out['매출년도'].astype('int16')
+    for col in CATEGORY_COLUMNS:
+        if col in out.columns:
+            out[col] = out[col].astype('category')
+    for col in MEASURE_COLUMNS:
+        out[col] = out[col].astype('float64')
+    if '고객명' in out.columns:
+        out = customers.intern(out, dimension)
+    return out[[c for c in COLUMN_ORDER if c in out.columns]]
+
+
+def write_columnar(frame, path, dimension):
+    to_columnar(frame, dimension).to_parquet(path, index=False)
+
+
+def _partitioning(name):
+    return ds.partitioning(pa.schema([(col, PARTITION_TYPES[col]) for col in PARTITIONS[name]]), flavor='hive')
+
+
+def write_partitioned(frame, dataset_dir, partition_cols, dimension, years=None):
+    """요약을 분할 열 값별 폴더로 나눠 저장합니다.
+
+    years를 주면 해당 매출년도 폴더만 다시 쓰고 나머지 폴더는 건드리지 않습니다(증분 반영).
+    다시 쓰는 폴더는 하나씩 교체하므로 읽는 쪽에서 데이터셋 전체가 사라지는 순간이 없습니다.
+    쓰지 않은 대상 폴더(데이터가 없어진 연도·상품)는 마지막에 지웁니다.
+    """
+    columnar = to_columnar(frame, dimension)
+    if years is not None:
+        columnar = columnar[columnar['매출년도'].isin(list(years))]
+    for col in partition_cols:
+        if col in CATEGORY_COLUMNS:
+            columnar[col] = columnar[col].astype(str)
+    table = pa.Table.from_pandas(columnar, preserve_index=False)
+    partitioning = ds.partitioning(pa.schema([(col, PARTITION_TYPES[col]) for col in partition_cols]), flavor='hive')
+    written = set()
+    ds.write_dataset(table, dataset_dir, format='parquet', partitioning=partitioning,
+                     basename_template='part-{i}.parquet', existing_data_behavior='delete_matching',
+                     file_visitor=lambda written_file: written.add(os.path.normpath(written_file.path)))
+    _remove_stale_files(dataset_dir, partitioning, written, years)
+
+
+def _remove_stale_files(dataset_dir, partitioning, written, years):
+    # 이번에 쓰지 않은 대상 연도의 파일과 빈 폴더 정리
+    dataset = ds.dataset(dataset_dir, format='parquet', partitioning=partitioning)
+    for fragment in dataset.get_fragments():
+        path = os.path.normpath(fragment.path)
+        year = ds.get_partition_keys(fragment.partition_expression).get('매출년도')
+        if path not in written and (years is None or year in years):
+            os.remove(path)
+    for folder, subfolders, files in os.walk(dataset_dir, topdown=False):
+        if folder != dataset_dir and not files and not os.listdir(folder):
+            os.rmdir(folder)
+
+
+def write_summary(name, frame, data_dir, dimension, years=None):
+    """요약 하나를 저장 형식(분할 폴더 또는 단일 Parquet)에 맞게 씁니다.
+
+    years를 주면 분할 저장하는 요약은 해당 매출년도 폴더만 다시 씁니다 (단일 Parquet은 전체).
+    """
+    if name in PARTITIONS:
+        write_partitioned(frame, os.path.join(data_dir, name), PARTITIONS[name], dimension, years)
+        # 분할 저장 전의 단일 파일은 로더가 우선 읽지 않도록 정리
+        flat_path = os.path.join(data_dir, f'{name}.parquet')
+        if os.path.exists(flat_path):
+            os.remove(flat_path)
+    else:
+        write_columnar(frame, os.path.join(data_dir, f'{name}.parquet'), dimension)
+
+
+def write_customers(dimension, data_dir=DATA_DIR):
+    dimension.to_parquet(os.path.join(data_dir, f'{CUSTOMER_DIM}.parquet'))
+    dimension.to_csv(os.path.join(data_dir, f'{CUSTOMER_DIM}.csv'), encoding='utf-8-sig')
+
+
+def _read_csv_summary(path, usecols=None):
+    return pd.read_csv(path, encoding='utf-8-sig', usecols=usecols, dtype={'고객명': str, '매출년월': str})
+
+
+def read_customers(data_dir=DATA_DIR):
+    """고객 차원 테이블(index=고객ID)을 읽습니다.
+
+    차원 파일이 없으면 폴더 안 요약 CSV들의 고객명을 모아 새로 만듭니다.
+    이때 고객ID는 이 폴더의 요약 파일들 안에서만 일관됩니다. 요약이 하나도 없으면 None.
+    """
+    parquet_path = os.path.join(data_dir, f'{CUSTOMER_DIM}.parquet')
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path)
+    csv_path = os.path.join(data_dir, f'{CUSTOMER_DIM}.csv')
+    if os.path.exists(csv_path):
+        return pd.read_csv(csv_path, encoding='utf-8-sig', index_col='고객ID', dtype={'고객명': str, '매칭키': str})
+
+    frames = [_read_csv_summary(os.path.join(data_dir, f'{name}.csv'), usecols=['고객명', '사용량'])
+              for name in SUMMARIES if os.path.exists(os.path.join(data_dir, f'{name}.csv'))]
+    if not frames:
+        return None
+    names = pd.concat(frames)
+    return customers.build_dimension(names['고객명'], names['사용량'])
+
+
+def partition_values(name, data_dir=DATA_DIR):
+    """분할 저장된 요약의 분할 열별 값 목록 (폴더 이름만 사용). 분할 저장이 아니면 None."""
+    dataset_dir = os.path.join(data_dir, name)
+    if name not in PARTITIONS or not os.path.isdir(dataset_dir):
+        return None
+    dataset = ds.dataset(dataset_dir, format='parquet', partitioning=_partitioning(name))
+    values = {col: set() for col in PARTITIONS[name]}
+    for fragment in dataset.get_fragments():
+        for col, value in ds.get_partition_keys(fragment.partition_expression).items():
+            values[col].add(value)
+    return {col: sorted(found) for col, found in values.items()}
+
+
+def _filter_expression(years, products, columns):
+    expression = None
+    for col, values in [('매출년도', years), ('상품', products)]:
+        if values is None or col not in columns:
+            continue
+        # 값 목록에 열 타입을 지정 (빈 목록은 null 타입으로 추론되어 isin이 실패함)
+        condition = ds.field(col).isin(pa.array(list(values), PARTITION_TYPES[col]))
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _filter_frame(frame, years, products):
+    if years is not None:
+        frame = frame[frame['매출년도'].isin(list(years))]
+    if products is not None and '상품' in frame.columns:
+        frame = frame[frame['상품'].isin(list(products))]
+    return frame
+
+
+def _ordered(frame):
+    for col in CATEGORY_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].astype('category')
+    return frame[[c for c in COLUMN_ORDER if c in frame.columns]]
+
+
+def read_summary(name, data_dir=DATA_DIR, dimension=None, memory_map=False, years=None, products=None,
+                 columns=None):
+    """요약 데이터를 분할 폴더 → Parquet → CSV 순으로 찾아 읽습니다. 모두 없으면 None.
+
+    years·products를 주면 해당 연도·상품 행만 반환합니다. 분할 저장된 요약은 조건에 맞는
+    폴더만 읽고, 단일 Parquet은 행 그룹 통계로 건너뜁니다. columns는 읽을 열 목록입니다.
+    CSV를 읽을 때는 dimension(없으면 read_customers 결과)으로 고객명을 고객ID로 바꿉니다.
+    memory_map이면 Parquet 파일을 통째로 버퍼에 읽지 않고 메모리 맵으로 읽습니다.
+    """
+    dataset_dir = os.path.join(data_dir, name)
+    if name in PARTITIONS and os.path.isdir(dataset_dir):
+        dataset = ds.dataset(dataset_dir, format='parquet', partitioning=_partitioning(name))
+        table = dataset.to_table(columns=columns, filter=_filter_expression(years, products, dataset.schema.names))
+        return _ordered(table.to_pandas())
+
+    parquet_path = os.path.join(data_dir, f'{name}.parquet')
+    if os.path.exists(parquet_path):
+        names = pq.read_schema(parquet_path).names
+        return pd.read_parquet(parquet_path, columns=columns, memory_map=memory_map,
+                               filters=_filter_expression(years, products, names))
+
+    csv_path = os.path.join(data_dir, f'{name}.csv')
+    if os.path.exists(csv_path):
+        if dimension is None:
+            dimension = read_customers(data_dir)
+        frame = _filter_frame(to_columnar(_read_csv_summary(csv_path), dimension), years, products)
+        return frame if columns is None else frame[columns]
+    return None
+
+
+def convert_csv_dir(data_dir=DATA_DIR):
+    """폴더 안의 요약 CSV를 모두 Parquet(월별 요약은 분할 폴더)으로 변환하고 고객 차원 테이블을 씁니다."""
+    frames = {name: _read_csv_summary(os.path.join(data_dir, f'{name}.csv'))
+              for name in SUMMARIES if os.path.exists(os.path.join(data_dir, f'{name}.csv'))}
+    if not frames:
+        return
+    names = pd.concat([frame[['고객명', '사용량']] for frame in frames.values()])
+    dimension = customers.build_dimension(names['고객명'], names['사용량'])
+    write_customers(dimension, data_dir)
+    print(f"✅ {CUSTOMER_DIM}: 고객 {len(dimension):,}명 (고객명 변형 {names['고객명'].nunique() - len(dimension):,}개 통합)")
+    for name, frame in frames.items():
+        write_summary(name, frame, data_dir, dimension)
+        print(f"✅ {name} 저장 완료")
+
+
+if __name__ == '__main__':
+    convert_csv_dir(sys.argv[1] if len(sys.argv) > 1 else DATA_DIR)
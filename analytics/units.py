@@ -0,0 +1,31 @@
+"""분석 단위(㎥, 천㎥, MJ, GJ)와 기준 단위 간 변환.
+
+데이터는 항상 기준 단위(사용량 ㎥, 사용열량 MJ)로 보관하고, 단위는 집계 결과나
+표시 직전의 작은 결과에만 적용합니다. 사용자가 입력한 임계값은 반대로 기준 단위로
+바꿔 비교합니다.
+"""
+
+# 단위 옵션: (기준 열, 배율)
+UNITS = {
+    "㎥": ("사용량", 1),
+    "천㎥": ("사용량", 1000),
+    "MJ": ("사용열량", 1),
+    "GJ": ("사용열량", 1000),
+}
+UNIT_OPTIONS = list(UNITS)
+
+
+def unit_spec(unit_option):
+    """단위 옵션에 해당하는 (기준 열, 배율)을 반환합니다."""
+    return UNITS[unit_option]
+
+
+def to_base(value, unit_option):
+    """표시 단위 값을 기준 단위 값으로 변환합니다 (예: 임계값 1,000 천㎥ → 1,000,000 ㎥)."""
+    return value * UNITS[unit_option][1]
+
+
+def from_base(values, unit_option):
+    """기준 단위 값(스칼라, Series, DataFrame)을 표시 단위로 변환합니다."""
+    factor = UNITS[unit_option][1]
+    return values if factor == 1 else values / factor
@@ -1,20 +1,87 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import os
+
+from analytics import export, storage, units
+from analytics.charts import figure_payload_size, trend_figure
+from analytics import ranking
+from views import instrument
+from views.export import download_section
+from views.shared import load_customer_names, load_summary
 
 # 1. 페이지 설정
 st.set_page_config(page_title="산업용 주요고객 분석 리포트", layout="wide")
+profile = instrument.start("app")
+
+RENDER_MODES = ["표준", "경량 (WebGL)"]
+DEFAULT_CHART_HEIGHT = 800
 
-@st.cache_data
 def load_summary_data():
-    # 파일 경로 설정 (배포용 상대 경로)
-    file_path = 'data/industry_yearly_summary.csv'
-    if not os.path.exists(file_path):
-        return None
-    return pd.read_csv(file_path, encoding='utf-8-sig')
+    # 세션 공유 데이터셋의 연간 요약 (Parquet 우선, 없으면 CSV)
+    return load_summary(storage.YEARLY_SUMMARY)
 
-df_raw = load_summary_data()
+@st.cache_resource
+def load_rank_indexes():
+    # 지표별 연도 순위 인덱스 (프로세스당 1회 생성, 읽기 전용이라 세션 간 공유)
+    return ranking.build_rank_indexes(load_summary_data(), load_customer_names())
+
+@st.cache_data
+def get_rank_table(metric, year_from, year_to, top_n, unit_option):
+    return ranking.rank_table(load_rank_indexes()[metric], year_from, year_to, top_n, unit_option)
+
+@st.cache_data
+def get_trend_rows(metric, year_from, year_to, top_n, unit_option):
+    return ranking.trend_rows(load_rank_indexes()[metric], year_from, year_to, top_n, unit_option)
+
+# 💡 아래 캐시는 데이터 조건(지표·연도·N·단위)만 키로 사용하고, 표시 전용 설정은 포함하지 않음
+@st.cache_data
+def get_rank_pivot(metric, year_from, year_to, top_n, unit_option):
+    return ranking.rank_pivot(get_rank_table(metric, year_from, year_to, top_n, unit_option))
+
+@st.cache_data
+def get_customer_pivot(metric, year_from, year_to, top_n, unit_option):
+    return ranking.customer_pivot(get_trend_rows(metric, year_from, year_to, top_n, unit_option), metric)
+
+@st.cache_data
+def get_rank_movers(metric, year_from, year_to, top_n, unit_option):
+    risers, fallers = load_rank_indexes()[metric].rank_movers(year_from, year_to, n=top_n)
+    return [movers.assign(**{metric: units.from_base(movers[metric], unit_option)}) for movers in (risers, fallers)]
+
+@st.cache_data
+def get_trend_export(metric, year_from, year_to, top_n, unit_option, fmt):
+    # 내려받기 파일 (요청했을 때만 만들고 조건·형식별로 캐시)
+    df_plot = get_trend_rows(metric, year_from, year_to, top_n, unit_option)
+    return export.export_bytes(df_plot[['고객명', '매출년도', metric]], fmt)
+
+@st.cache_data
+def get_trend_figure(metric, year_from, year_to, top_n, unit_option, show_labels, webgl):
+    # 그래프와 전송 크기 (세로 크기는 표시할 때 적용)
+    df_plot = get_trend_rows(metric, year_from, year_to, top_n, unit_option)
+    fig = trend_figure(
+        df_plot, metric, ranking.last_points(df_plot),
+        title=f"연도별 {unit_option} 추이 (상위 {top_n}개 업체 기준)",
+        height=DEFAULT_CHART_HEIGHT, unit_label=unit_option,
+        show_labels=show_labels, webgl=webgl
+    )
+    return fig, figure_payload_size(fig)
+
+@st.fragment
+def trend_chart(metric, year_from, year_to, top_n, unit_option):
+    # 그래프 표시 설정은 이 영역만 다시 실행 (데이터 조회·표는 다시 계산하지 않음)
+    col_height, col_labels, col_mode = st.columns([2, 1, 1])
+    chart_height = col_height.slider("그래프 세로 크기 조절", min_value=600, max_value=2000,
+                                     value=DEFAULT_CHART_HEIGHT, step=100)
+    show_labels = col_labels.checkbox("그래프 위에 데이터 수치 표시", value=True)
+    render_mode = col_mode.radio("🖥️ 그래프 렌더링", RENDER_MODES, index=0, horizontal=True,
+                                 help="경량 모드는 WebGL로 그리고, 수치는 마지막 연도에만 표시합니다 (나머지는 마우스 오버).")
+
+    fig, payload = get_trend_figure(metric, year_from, year_to, top_n, unit_option,
+                                    show_labels, render_mode == RENDER_MODES[1])
+    fig.update_layout(height=chart_height)
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"📦 그래프 전송 크기: {payload / 1024:,.1f} KB")
+    return fig
+
+with profile.stage("load") as stage:
+    df_raw = stage.measure(load_summary_data())
 
 if df_raw is not None:
     # --- 사이드바 설정 ---
@@ -23,114 +90,67 @@ if df_raw is not None:
     # 1. 단위 선택 (라디오 버튼)
     unit_option = st.sidebar.radio(
         "📊 분석 단위 선택", 
-        ["㎥", "천㎥", "MJ", "GJ"],
+        units.UNIT_OPTIONS,
         index=0,
         horizontal=True
     )
 
-    # 단위 변환 로직
-    if unit_option == "㎥":
-        target_col, div_factor, unit_label = "사용량", 1, "㎥"
-    elif unit_option == "천㎥":
-        target_col, div_factor, unit_label = "사용량", 1000, "천㎥"
-    elif unit_option == "MJ":
-        target_col, div_factor, unit_label = "사용열량", 1, "MJ"
-    else: # GJ
-        target_col, div_factor, unit_label = "사용열량", 1000, "GJ"
-
-    # 데이터 복사 및 단위 변환 적용
-    df = df_raw.copy()
-    df[target_col] = df[target_col] / div_factor
+    # 단위는 기준 열만 정하고, 변환은 조회된 결과에만 적용
+    target_col, _ = units.unit_spec(unit_option)
+    unit_label = unit_option
+
+    with profile.stage("rank_index"):
+        rank_index = load_rank_indexes()[target_col]
     
     # 기타 설정
     top_n = st.sidebar.slider("표시할 상위 순위(N)", min_value=5, max_value=50, value=20)
     
-    all_years = sorted(df['매출년도'].unique())
+    all_years = rank_index.years.tolist()
     selected_years = st.sidebar.select_slider("분석 연도 범위", options=all_years, value=(min(all_years), max(all_years)))
 
-    chart_height = st.sidebar.slider("그래프 세로 크기 조절", min_value=600, max_value=2000, value=800, step=100)
-    show_labels = st.sidebar.checkbox("그래프 위에 데이터 수치 표시", value=True)
-
-    # --- 데이터 가공 ---
-    # 연도 필터링
-    df_filtered = df[(df['매출년도'] >= selected_years[0]) & (df['매출년도'] <= selected_years[1])].copy()
-    
-    # 순위 계산
-    df_filtered['순위'] = df_filtered.groupby('매출년도')[target_col].rank(ascending=False, method='min')
-    df_filtered['표시텍스트'] = df_filtered.apply(lambda x: f"{x['고객명']}\n({x[target_col]:,.0f})", axis=1)
 
-    # 시각화용 데이터 필터링 (마지막 연도 TOP N 기준)
-    base_year = selected_years[1]
-    top_n_list = df_filtered[(df_filtered['매출년도'] == base_year) & (df_filtered['순위'] <= top_n)]['고객명'].tolist()
-    df_plot = df_filtered[df_filtered['고객명'].isin(top_n_list)].copy()
+    # --- 데이터 조건 (이 값들만 조회·표 계산 캐시의 키로 사용) ---
+    data_key = (target_col, selected_years[0], selected_years[1], top_n, unit_option)
 
     # --- 시각화 (그래프) ---
     st.title("🏭 산업용 주요고객 분석 대시보드")
     st.subheader(f"📊 연도별 추이 분석 (단위: {unit_label})")
-    
-    fig = px.line(
-        df_plot, x='매출년도', y=target_col, color='고객명', markers=True,
-        text=target_col if show_labels else None,
-        title=f"연도별 {unit_option} 추이 (상위 {top_n}개 업체 기준)",
-        template='plotly_white'
-    )
-
-    # 선 끝에 이름 및 지시선 표시
-    for i, customer in enumerate(top_n_list):
-        c_data = df_plot[df_plot['고객명'] == customer].sort_values('매출년도')
-        if not c_data.empty:
-            last_point = c_data.iloc[-1]
-            fig.add_annotation(
-                x=last_point['매출년도'], 
-                y=last_point[target_col],
-                text=f"<b>{customer}</b>",
-                showarrow=True, arrowhead=0,
-                arrowcolor=fig.data[i].line.color,
-                ax=60, ay=0, xanchor="left",
-                font=dict(size=12, color=fig.data[i].line.color)
-            )
-
-    fig.update_traces(
-        textposition="top center", 
-        texttemplate='%{y:,.0f}',
-        line=dict(width=3),
-        showlegend=False 
-    )
 
-    fig.update_layout(
-        height=chart_height,
-        margin=dict(r=200, t=100), 
-        hovermode="x unified",
-        xaxis=dict(tickmode='linear', dtick=1),
-        yaxis=dict(title=f"판매량 ({unit_label})", tickformat=",.0f", gridcolor='lightgrey')
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    with profile.stage("trend_chart") as stage:
+        stage.measure(trend_chart(*data_key))
 
     # --- 데이터 테이블 섹션 ---
     st.divider()
     
     st.subheader(f"🏆 1. 연도별 TOP {top_n} 순위표 ({unit_label})")
-    rank_pivot = df_filtered[df_filtered['순위'] <= top_n].pivot(
-        index='순위', columns='매출년도', values='표시텍스트'
-    ).fillna("-")
-    st.dataframe(rank_pivot.sort_index(), use_container_width=True)
+    with profile.stage("rank_pivot") as stage:
+        st.dataframe(stage.measure(get_rank_pivot(*data_key)), use_container_width=True)
 
     st.subheader(f"📊 2. 고객명별 연도별 상세 현황 ({unit_label})")
-    customer_pivot = df_plot.pivot_table(
-        index='고객명', columns='매출년도', values=target_col, aggfunc='sum',
-        margins=True, margins_name="총계"
-    ).fillna(0).sort_values('총계', ascending=False)
-    st.dataframe(customer_pivot.style.format("{:,.0f}"), use_container_width=True)
+    with profile.stage("customer_pivot") as stage:
+        customer_pivot = stage.measure(get_customer_pivot(*data_key))
+        st.dataframe(customer_pivot.style.format("{:,.0f}"), use_container_width=True)
+
+    if selected_years[0] != selected_years[1]:
+        st.subheader(f"🔀 3. 순위 변동 상위 업체 ({selected_years[0]}년 → {selected_years[1]}년)")
+        with profile.stage("rank_movers") as stage:
+            risers, fallers = get_rank_movers(*data_key)
+            col_up, col_down = st.columns(2)
+            for col, title, movers in [(col_up, "📈 순위 상승", risers), (col_down, "📉 순위 하락", fallers)]:
+                stage.measure(movers)
+                col.markdown(f"**{title}**")
+                col.dataframe(movers.style.format({target_col: "{:,.0f}", '순위변동': "{:+,.0f}"}), use_container_width=True)
 
     # --- 📥 데이터 다운로드 ---
     st.divider()
-    csv_raw = df_plot[['고객명', '매출년도', target_col]].to_csv(index=False, encoding='utf-8-sig')
-    st.download_button(
-        label=f"📄 현재 조건 데이터({unit_label}) 다운로드",
-        data=csv_raw,
-        file_name=f"산업용_상위고객_분석_{unit_label}.csv",
-        mime="text/csv",
-    )
+    with profile.stage("export"):
+        # 파일은 내려받기 버튼을 눌렀을 때만 만듦 (평소 실행에는 비용 없음)
+        download_section(
+            f"📄 현재 조건 데이터({unit_label}) 다운로드", f"산업용_상위고객_분석_{unit_label}",
+            lambda fmt: get_trend_export(*data_key, fmt), key="trend_export"
+        )
 
 else:
-    st.error("데이터 요약 파일을 확인해 주세요.")
\ No newline at end of file
+    st.error("데이터 요약 파일을 확인해 주세요.")
+
+instrument.finish(profile)
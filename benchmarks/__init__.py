@@ -0,0 +1 @@
+"""대시보드 처리 단계별 성능 측정 (합성 데이터 사용)."""
@@ -0,0 +1,240 @@
+"""페이지 처리 단계별 시간·최대 메모리 측정.
+
+규모(월별 요약 행 수)마다 합성 데이터를 만들고 각 단계를 실행합니다. 시간은 --repeat회
+중 최솟값, 최대 메모리는 tracemalloc으로 한 번 더 실행해 측정합니다. 'legacy_' 단계는
+분석 모듈 도입 전 페이지에 있던 방식 그대로이며 비교 기준으로 남겨 둡니다.
+
+사용 예:
+    python -m benchmarks.run --rows 100000 1000000 --customers-per-row 0.02
+    python -m benchmarks.run --rows 5000000 --only rank pivot --output bench.jsonl
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from analytics import customers, growth, ranking, storage
+from analytics.matrix import build_monthly_matrix, report_window
+from analytics.pipeline import yearly_from_monthly
+from analytics.race import color_map, race_figure, rolling_race, yearly_race
+from analytics.report import render_table
+from benchmarks.synthetic import generate_monthly
+
+METRIC = '사용량'
+TOP_N = 20
+REPORT_RANKS = 5000
+
+
+def prepare(n_rows, n_customers, work_dir):
+    """규모별 입력 데이터와 파일을 준비합니다."""
+    monthly_raw = generate_monthly(n_rows, n_customers)
+    yearly_raw = yearly_from_monthly(monthly_raw)
+
+    dimension = customers.build_dimension(monthly_raw['고객명'], monthly_raw['사용량'])
+    names = dimension['고객명']
+
+    paths = {}
+    for name, frame in [(storage.MONTHLY_SUMMARY, monthly_raw), (storage.YEARLY_SUMMARY, yearly_raw)]:
+        paths[f'{name}.csv'] = os.path.join(work_dir, f'{name}.csv')
+        paths[f'{name}.parquet'] = os.path.join(work_dir, f'{name}.parquet')
+        frame.to_csv(paths[f'{name}.csv'], index=False, encoding='utf-8-sig')
+        storage.write_columnar(frame, paths[f'{name}.parquet'], dimension)
+    # 연도별 분할 폴더 (단일 Parquet과 비교용으로 별도 폴더에 저장)
+    paths['partitioned'] = os.path.join(work_dir, 'partitioned')
+    storage.write_summary(storage.MONTHLY_SUMMARY, monthly_raw, paths['partitioned'], dimension)
+
+    monthly = storage.to_columnar(monthly_raw, dimension)
+    yearly = storage.to_columnar(yearly_raw, dimension)
+    legacy_monthly = monthly_raw.assign(매출년도=monthly_raw['매출년월'].str[:4], 월=monthly_raw['매출년월'].str[5:])
+    year = int(yearly['매출년도'].max())
+    index = ranking.RankIndex(yearly, METRIC, names)
+    matrix = build_monthly_matrix(monthly, year, METRIC, names)
+    years = index.years.tolist()
+    return {
+        'work_dir': work_dir, 'paths': paths, 'dimension': dimension, 'names': names,
+        'monthly': monthly, 'yearly': yearly,
+        'legacy_monthly': legacy_monthly, 'legacy_yearly': yearly_raw,
+        'year': year, 'years': years, 'index': index, 'matrix': matrix,
+        'report': report_window(matrix, 1, REPORT_RANKS, 0, '천㎥'),
+    }
+
+
+# --- 현재 구현 ---
+
+def case_csv_load(ctx):
+    return storage.to_columnar(pd.read_csv(ctx['paths'][f'{storage.MONTHLY_SUMMARY}.csv'], encoding='utf-8-sig'),
+                               ctx['dimension'])
+
+
+def case_parquet_load(ctx):
+    return pd.read_parquet(ctx['paths'][f'{storage.MONTHLY_SUMMARY}.parquet'])
+
+
+def case_partition_load(ctx):
+    # 분할 폴더에서 한 연도만 읽기 (월별 보고서 페이지의 로드 방식)
+    return storage.read_summary(storage.MONTHLY_SUMMARY, ctx['paths']['partitioned'], years=[ctx['year']])
+
+
+def case_trend_rows(ctx):
+    # 추이 그래프 행 전체 경로 (인덱스 구간 선택 + 고객명 연결 + 결과에만 단위 적용)
+    return ranking.trend_rows(ctx['index'], ctx['years'][0], ctx['years'][-1], TOP_N, '천㎥')
+
+
+def case_rank_index(ctx):
+    return ranking.RankIndex(ctx['yearly'], METRIC, ctx['names'])
+
+
+def case_top_n(ctx):
+    return ranking.rank_table(ctx['index'], ctx['years'][0], ctx['years'][-1], TOP_N, '천㎥')
+
+
+def case_monthly_matrix(ctx):
+    return build_monthly_matrix(ctx['monthly'], ctx['year'], METRIC, ctx['names'])
+
+
+def case_report_window(ctx):
+    return report_window(ctx['matrix'], 1, REPORT_RANKS, 0, '천㎥')
+
+
+def case_html_table(ctx):
+    values, total = ctx['report']
+    return render_table(values, total)
+
+
+def case_race_yearly(ctx):
+    race = yearly_race(ctx['yearly'], METRIC, TOP_N, ctx['names'])
+    return race_figure(race, color_map(race['고객명'].unique()), "", METRIC)
+
+
+def case_race_rolling(ctx):
+    race = rolling_race(ctx['monthly'], METRIC, TOP_N, ctx['names'])
+    return race_figure(race, color_map(race['고객명'].unique()), "", METRIC)
+
+
+def case_growth_movers(ctx):
+    matrix = growth.GrowthMatrix(ctx['monthly'], METRIC, ctx['names'])
+    table = matrix.growth_table(ctx['years'][0], ctx['years'][-1])
+    return growth.top_movers(table, "증감률", n=TOP_N)
+
+
+# --- 분석 모듈 도입 전 페이지 방식 (비교 기준) ---
+
+def case_legacy_unit_conversion(ctx):
+    # 데이터 전체 단위 변환 (현재 구현은 이 단계 없이 조회 결과에만 적용하므로 대응 단계 없음)
+    df = ctx['legacy_yearly'].copy()
+    df[METRIC] = df[METRIC] / 1000
+    return df
+
+
+def case_legacy_rank(ctx):
+    df = ctx['legacy_yearly']
+    return df.groupby('매출년도')[METRIC].rank(ascending=False, method='min')
+
+
+def case_legacy_top_n(ctx):
+    df = ctx['legacy_yearly'].copy()
+    df['순위'] = df.groupby('매출년도')[METRIC].rank(ascending=False, method='min')
+    top_n_list = df[(df['매출년도'] == ctx['year']) & (df['순위'] <= TOP_N)]['고객명'].tolist()
+    return df[df['고객명'].isin(top_n_list)]
+
+
+def case_legacy_pivot(ctx):
+    df = ctx['legacy_monthly']
+    df_filtered = df[df['매출년도'] == str(ctx['year'])].copy()
+    df_filtered['display_value'] = df_filtered[METRIC] / 1000
+    pivot = df_filtered.pivot_table(
+        index='고객명', columns='월', values='display_value', aggfunc='sum', margins=True, margins_name="연간 합계"
+    ).fillna(0)
+    main_data = pivot.drop("연간 합계").sort_values('연간 합계', ascending=False)
+    main_data.insert(0, '순위', range(1, len(main_data) + 1))
+    return main_data
+
+
+def case_legacy_html_table(ctx):
+    values, _ = ctx['report']
+    html_table = '<table class="report-table"><thead><tr><th>순위</th><th>고객명</th>'
+    months = list(range(1, 13))
+    for m in months: html_table += f'<th>{m:02d}월</th>'
+    html_table += '<th>연간 합계</th></tr></thead><tbody>'
+    for idx, row in values.iterrows():
+        html_table += '<tr class="">'
+        html_table += f'<td class="rank-col">{row["순위"]}</td>'
+        html_table += f'<td class="name-col">{idx}</td>'
+        for m in months: html_table += f'<td>{row.get(m, 0):,.0f}</td>'
+        html_table += f'<td>{row["연간 합계"]:,.0f}</td></tr>'
+    return html_table + '</tbody></table>'
+
+
+def case_legacy_race_frames(ctx):
+    df = ctx['legacy_yearly']
+    frames = []
+    for year in sorted(df['매출년도'].unique()):
+        year_data = df[df['매출년도'] == year].nlargest(TOP_N, METRIC).sort_values(METRIC, ascending=True)
+        frames.append(go.Frame(
+            data=[go.Bar(x=year_data[METRIC], y=year_data['고객명'], orientation='h',
+                         text=[f" {v:,.0f}" for v in year_data[METRIC]], textposition='outside')],
+            layout=go.Layout(yaxis=dict(categoryarray=year_data['고객명'].tolist(), categoryorder="array")),
+            name=str(year)
+        ))
+    return frames
+
+
+CASES = {name[len('case_'):]: func for name, func in globals().items() if name.startswith('case_')}
+
+
+def measure(func, ctx, repeat):
+    """(최소 실행 시간 초, 최대 메모리 byte)를 반환합니다."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(ctx)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        func(ctx)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 처리 단계별 성능을 측정합니다.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000], help="월별 요약 행 수 (규모)")
+    parser.add_argument('--customers-per-row', type=float, default=1 / 60,
+                        help="행 수 대비 고객 수 비율 (기본값: 1/60, 고객당 약 5년치)")
+    parser.add_argument('--repeat', type=int, default=3, help="시간 측정 반복 횟수")
+    parser.add_argument('--only', nargs='*', default=None, help="이름에 포함된 단계만 실행 (예: rank pivot)")
+    parser.add_argument('--output', default=None, help="결과를 추가할 JSONL 파일")
+    args = parser.parse_args(argv)
+
+    cases = {name: func for name, func in CASES.items()
+             if not args.only or any(key in name for key in args.only)}
+
+    for n_rows in args.rows:
+        n_customers = max(int(n_rows * args.customers_per_row), 1)
+        with tempfile.TemporaryDirectory() as work_dir:
+            ctx = prepare(n_rows, n_customers, work_dir)
+            print(f"\n📏 월별 {n_rows:,}행 / 고객 {n_customers:,}명 / 연간 {len(ctx['yearly']):,}행")
+            print(f"{'단계':<24}{'시간(ms)':>12}{'최대 메모리(MB)':>18}")
+            for name, func in cases.items():
+                seconds, peak = measure(func, ctx, args.repeat)
+                print(f"{name:<24}{seconds * 1000:>12,.1f}{peak / 1024 / 1024:>18,.1f}")
+                if args.output:
+                    with open(args.output, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps({
+                            'timestamp': datetime.now().isoformat(timespec='seconds'),
+                            'rows': n_rows, 'customers': n_customers, 'case': name,
+                            'seconds': seconds, 'peak_bytes': peak,
+                        }, ensure_ascii=False) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import plotly.express as px
+import streamlit as st
+
+from analytics import export, growth, storage, units
+from views import instrument
+from views.export import download_section
+from views.shared import load_customer_names, load_summary
+
+st.set_page_config(page_title="산업용 고객 성장·감소 분석", layout="wide")
+profile = instrument.start("growth")
+
+# 증감률·CAGR 순위에 포함할 최소 기준연도 합계 기본값 (기준 단위 ㎥·MJ)
+DEFAULT_MIN_BASE = {"사용량": 1000000, "사용열량": 40000000}
+# 표 표시 형식 (값 열은 표시 단위 정수, 비율 열은 백분율)
+MOVER_FORMAT = {**{col: "{:,.0f}" for col in growth.VALUE_COLUMNS},
+                '증감률': "{:+.1%}", 'CAGR': "{:+.1%}", '최대월비중': "{:.1%}", '최대월': "{:d}월"}
+
+def load_monthly_data():
+    return load_summary(storage.MONTHLY_SUMMARY)
+
+@st.cache_resource
+def load_growth_matrix(metric):
+    # 지표별 전체 기간 고객×월 행렬 (프로세스당 1회 생성, 읽기 전용이라 세션 간 공유)
+    return growth.GrowthMatrix(load_monthly_data(), metric, load_customer_names())
+
+@st.cache_data
+def get_growth_table(metric, year_from, year_to):
+    # 모든 고객의 성장 지표 (기준 단위, 지표·연도 범위별 캐시)
+    return load_growth_matrix(metric).growth_table(year_from, year_to)
+
+def to_display(rows, unit_option):
+    # 값 열만 표시 단위로 변환 (비율 열은 그대로)
+    return rows.assign(**{col: units.from_base(rows[col], unit_option) for col in growth.VALUE_COLUMNS})
+
+@st.cache_data
+def get_movers(metric, year_from, year_to, basis, top_n, min_base):
+    table = get_growth_table(metric, year_from, year_to)
+    return growth.top_movers(table, basis, n=top_n, min_base=min_base)
+
+@st.cache_data
+def get_growth_export(metric, year_from, year_to, unit_option, fmt):
+    # 전체 고객 성장 지표 내려받기 파일 (요청했을 때만 만들고 조건·형식별로 캐시)
+    table = get_growth_table(metric, year_from, year_to)
+    rows = growth.with_names(to_display(table, unit_option), load_customer_names())
+    return export.export_bytes(rows, fmt)
+
+def show_movers(col, title, movers, names, unit_option):
+    col.markdown(f"**{title}**")
+    if not len(movers):
+        col.caption("해당 고객이 없습니다.")
+        return
+    rows = growth.with_names(to_display(movers, unit_option), names)
+    col.dataframe(rows.style.format(MOVER_FORMAT, na_rep="-"), use_container_width=True)
+
+with profile.stage("load") as stage:
+    df_monthly = stage.measure(load_monthly_data())
+
+if df_monthly is not None:
+    st.title("📈 산업용 고객 성장·감소 분석")
+
+    # --- 사이드바 설정 ---
+    st.sidebar.header("⚙️ 분석 설정")
+    unit_option = st.sidebar.radio("📊 분석 단위", units.UNIT_OPTIONS, index=0, horizontal=True)
+    target_col, _ = units.unit_spec(unit_option)
+
+    with profile.stage("growth_matrix"):
+        matrix = load_growth_matrix(target_col)
+
+    years = matrix.years
+    year_from, year_to = st.sidebar.select_slider("분석 연도 범위", options=years,
+                                                  value=(years[max(len(years) - 2, 0)], years[-1]))
+    basis = st.sidebar.radio("🏁 순위 기준", list(growth.MOVER_BASES), index=0)
+    top_n = st.sidebar.slider("표시할 업체 수", min_value=5, max_value=50, value=15)
+    default_min = int(units.from_base(DEFAULT_MIN_BASE[target_col], unit_option))
+    min_value = st.sidebar.number_input(f"🔍 최소 기준연도 합계 ({unit_option})", min_value=0, value=default_min,
+                                        help="기준연도(범위 첫 연도) 합계가 이 값 미만인 고객은 순위에서 제외합니다.")
+
+    st.caption(f"기준: {year_from}년 → {year_to}년 | 최근 12개월은 {matrix.last_month()}까지 | 단위: {unit_option}")
+
+    with profile.stage("movers") as stage:
+        growers, shrinkers = get_movers(target_col, year_from, year_to, basis, top_n,
+                                        units.to_base(min_value, unit_option))
+        names = load_customer_names()
+        col_up, col_down = st.columns(2)
+        for col, title, movers in [(col_up, "📈 성장 상위", growers), (col_down, "📉 감소 상위", shrinkers)]:
+            stage.measure(movers)
+            show_movers(col, title, movers, names, unit_option)
+
+    movers_ids = list(growers.index) + list(shrinkers.index)
+    if movers_ids:
+        st.divider()
+        st.subheader("📉 최근 12개월 합계 추이 (상·하위 고객)")
+        with profile.stage("rolling_chart") as stage:
+            rolling = units.from_base(matrix.rolling_totals(movers_ids), unit_option)
+            rolling = growth.with_names(rolling, names).reset_index()
+            long_rows = rolling.melt(id_vars='고객명', var_name='기준월', value_name='최근12개월')
+            fig = px.line(long_rows, x='기준월', y='최근12개월', color='고객명')
+            fig.update_layout(yaxis_title=f"최근 12개월 합계 ({unit_option})", legend_title_text="")
+            st.plotly_chart(fig, use_container_width=True)
+            stage.measure(fig)
+
+        st.subheader("🗓️ 월별 비중 (계절성)")
+        with profile.stage("seasonality") as stage:
+            shares = growth.with_names(matrix.seasonality(year_from, year_to, movers_ids), names)
+            st.dataframe(stage.measure(shares).style.format("{:.1%}", na_rep="-"), use_container_width=True)
+
+    # --- 📥 데이터 다운로드 ---
+    st.divider()
+    with profile.stage("export"):
+        download_section(
+            f"📄 전체 고객 성장 지표({unit_option}) 다운로드", f"산업용_고객성장_{year_from}_{year_to}_{unit_option}",
+            lambda fmt: get_growth_export(target_col, year_from, year_to, unit_option, fmt), key="growth_export"
+        )
+
+else:
+    st.error("월별 요약 파일을 찾을 수 없습니다.")
+
+instrument.finish(profile)
@@ -0,0 +1,145 @@
+"""analytics 핵심 단계를 기존(분석 모듈 도입 전) 페이지 방식과 비교하는 테스트.
+
+번들 데이터(data/*.csv)의 고객명 변형은 고객 차원 테이블로 합친 뒤 비교합니다.
+"""
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from analytics import customers, growth, pipeline, ranking, storage
+from analytics.matrix import MONTHS, build_monthly_matrix, report_window
+from analytics.report import render_table
+
+
+@pytest.fixture(scope='module')
+def dimension():
+    return storage.read_customers(storage.DATA_DIR)
+
+
+def read_merged_csv(name, dimension, keys):
+    # 요약 CSV를 읽고 고객명 변형을 대표 고객명으로 합침 (기존 페이지 입력과 같은 형식)
+    frame = pd.read_csv(f'{storage.DATA_DIR}/{name}.csv', encoding='utf-8-sig', dtype={'고객명': str, '매출년월': str})
+    frame['고객명'] = customers.canonical_names(frame['고객명'], dimension)
+    return frame.groupby(['고객명', keys])[['사용량', '사용열량']].sum().reset_index()
+
+
+@pytest.mark.parametrize('unit_option, top_n', [('천㎥', 20), ('GJ', 5)])
+def test_rank_table_matches_groupby_rank(dimension, unit_option, top_n):
+    legacy = read_merged_csv(storage.YEARLY_SUMMARY, dimension, '매출년도')
+    metric, factor = {'천㎥': ('사용량', 1000), 'GJ': ('사용열량', 1000)}[unit_option]
+    legacy[metric] = legacy[metric] / factor
+    legacy['순위'] = legacy.groupby('매출년도')[metric].rank(ascending=False, method='min')
+    expected = legacy[legacy['순위'] <= top_n]
+
+    yearly = storage.to_columnar(read_merged_csv(storage.YEARLY_SUMMARY, dimension, '매출년도'), dimension)
+    index = ranking.RankIndex(yearly, metric, dimension['고객명'])
+    years = index.years.tolist()
+    table = ranking.rank_table(index, years[0], years[-1], top_n, unit_option)
+
+    key = ['매출년도', '순위', '고객명']
+    expected = expected.astype({'매출년도': int, '순위': int}).sort_values(key).reset_index(drop=True)
+    actual = table.astype({'매출년도': int, '순위': int}).sort_values(key).reset_index(drop=True)
+    tm.assert_frame_equal(actual[[*key, metric]], expected[[*key, metric]], check_dtype=False)
+
+
+def test_report_window_matches_pivot_table(dimension):
+    legacy = read_merged_csv(storage.MONTHLY_SUMMARY, dimension, '매출년월')
+    year = int(legacy['매출년월'].str[:4].max())
+    rows = legacy[legacy['매출년월'].str[:4] == str(year)].assign(월=lambda f: f['매출년월'].str[5:].astype(int))
+    rows['display_value'] = rows['사용량'] / 1000
+    pivot = rows.pivot_table(index='고객명', columns='월', values='display_value', aggfunc='sum',
+                             margins=True, margins_name='연간 합계').fillna(0)
+    expected = pivot.drop('연간 합계').sort_values('연간 합계', ascending=False)
+
+    monthly = storage.to_columnar(legacy, dimension)
+    matrix = build_monthly_matrix(monthly, year, '사용량', dimension['고객명'])
+    values, total = report_window(matrix, 1, len(matrix), 0, '천㎥')
+
+    ranked_totals = expected['연간 합계'].to_numpy()
+    assert list(values['순위']) == list(range(1, len(expected) + 1))
+    np.testing.assert_allclose(values['연간 합계'].to_numpy(), ranked_totals)
+    actual = values.drop(columns='순위').sort_index()
+    expected = expected.reindex(columns=[*MONTHS, '연간 합계'], fill_value=0).sort_index()
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy())
+    np.testing.assert_allclose(total['연간 합계'], expected['연간 합계'].sum())
+
+    # 최소 합계 조건은 이진 탐색, 순위 범위는 슬라이싱
+    above, _ = report_window(matrix, 3, 10, 500, '천㎥')
+    assert list(above['순위']) == [r for r in range(3, 11) if ranked_totals[r - 1] >= 500]
+
+
+def test_render_table_rows():
+    report = pd.DataFrame({m: [1000.4, 2.0] for m in MONTHS}, index=pd.Index(['<가>', '나'], name='고객명'))
+    report['연간 합계'] = report[MONTHS].sum(axis=1)
+    report.insert(0, '순위', [1, 2])
+    html = render_table(report, report.drop(columns='순위').sum())
+    assert html.count('<tr>') == 3  # 머리글 + 2행
+    assert '&lt;가&gt;' in html and '1,000' in html and 'total-row' in html
+
+
+def test_build_dimension_merges_variants_and_keeps_ids():
+    names = ['(주)가나', '가나 주식회사', '다라', '㈜ 다라']
+    dimension = customers.build_dimension(names, [1, 100, 5, 1])
+    assert dimension['고객명'].tolist() == ['가나 주식회사', '다라']
+
+    grown = customers.build_dimension(['마바', '가나'], [1, 1], existing=dimension)
+    tm.assert_frame_equal(grown.iloc[:2], dimension)
+    assert grown.loc[2, '고객명'] == '마바'
+
+    frame = pd.DataFrame({'고객명': names, '월': [1, 1, 1, 2], '사용량': [1.0, 2.0, 3.0, 4.0], '사용열량': 0.0})
+    interned = customers.intern(frame, dimension).sort_values(['고객ID', '월']).reset_index(drop=True)
+    assert interned[['고객ID', '월', '사용량']].values.tolist() == [[0, 1, 3.0], [1, 1, 3.0], [1, 2, 4.0]]
+
+
+def raw_summary():
+    # 원본 요약 형식 (상품명, 고객명, 매출년월, 사용량, 사용열량), 고객명 변형 포함
+    rng = np.random.default_rng(0)
+    periods = [f'{y}-{m:02d}' for y in (2023, 2024) for m in range(1, 13)]
+    rows = []
+    for name in ['(주)가나', '가나 주식회사', '다라', '마바 유한회사']:
+        for product in ['산업용', '업무난방용']:
+            for period in periods:
+                rows.append((product, name, period))
+    frame = pd.DataFrame(rows, columns=['상품명', '고객명', '매출년월'])
+    frame['사용량'] = rng.uniform(1, 100, len(frame)).round(2)
+    frame.loc[frame['고객명'] == '가나 주식회사', '사용량'] *= 10
+    frame['사용열량'] = frame['사용량'] * 42.6
+    return frame
+
+
+def test_incremental_merge_matches_full_build():
+    summary = raw_summary()
+    full, full_dimension = pipeline.build_outputs(summary)
+
+    new_periods = ['2024-11', '2024-12']
+    first = summary[~summary['매출년월'].isin(new_periods)]
+    existing, dimension = pipeline.build_outputs(first)
+    delta, dimension = pipeline.build_outputs(summary[summary['매출년월'].isin(new_periods)], dimension=dimension)
+    merged = pipeline.merge_outputs(existing, delta, new_periods)
+
+    tm.assert_frame_equal(dimension, full_dimension)
+    for name, sort_keys in [(storage.YEARLY_SUMMARY, ['고객명', '매출년도']),
+                            (storage.MONTHLY_SUMMARY, ['고객명', '매출년월']),
+                            (storage.COMMERCIAL_SUMMARY, ['고객명', '매출년월', '상품'])]:
+        expected = full[name].sort_values(sort_keys).reset_index(drop=True)
+        actual = merged[name].sort_values(sort_keys).reset_index(drop=True)
+        tm.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_growth_table_matches_groupby():
+    summary = raw_summary()
+    outputs, dimension = pipeline.build_outputs(summary)
+    monthly = storage.to_columnar(outputs[storage.MONTHLY_SUMMARY], dimension)
+    table = growth.GrowthMatrix(monthly, '사용량', dimension['고객명']).growth_table(2023, 2024)
+
+    yearly = monthly.groupby(['고객ID', '매출년도'])['사용량'].sum().unstack()
+    np.testing.assert_allclose(table['증감'], yearly[2024] - yearly[2023])
+    np.testing.assert_allclose(table['CAGR'], yearly[2024] / yearly[2023] - 1)
+    np.testing.assert_allclose(table['최근12개월'], yearly[2024])
+    np.testing.assert_allclose(table['전년동기12개월'], yearly[2023])
+
+    growers, shrinkers = growth.top_movers(table, '증감', n=10)
+    assert (growers['증감'] > 0).all() and (shrinkers['증감'] < 0).all()
+    assert len(growers) + len(shrinkers) == (table['증감'] != 0).sum()
+    assert growers['증감'].is_monotonic_decreasing
@@ -0,0 +1 @@
+"""여러 페이지가 함께 쓰는 Streamlit 화면 구성 요소."""
@@ -0,0 +1,29 @@
+"""내려받기 영역 (모든 페이지 공용).
+
+파일은 사용자가 내려받기 버튼을 눌렀을 때만 만듭니다 (st.download_button에 함수를 넘기면
+클릭 시 별도 스레드에서 실행됨). 호출한 쪽의 st.cache_data 함수가 조회 조건·형식별로
+캐시하므로 같은 조건을 다시 내려받으면 다시 만들지 않습니다. 이 영역은 fragment라 형식을
+바꿔도 페이지 전체를 다시 실행하지 않습니다.
+
+build는 스크립트 실행 문맥(ScriptRunContext)이 없는 서버 스레드에서 호출됩니다.
+st.cache_data·st.cache_resource 캐시는 프로세스 전역이라 그대로 재사용되지만, 그 안의
+화면 출력(st.* 표시, 캐시 스피너 포함)은 무시되므로 build에서는 데이터만 만들어야 합니다.
+"""
+import streamlit as st
+
+from analytics import export
+
+
+@st.fragment
+def download_section(label, file_stem, build, key):
+    """형식 선택과 내려받기 버튼. build(fmt)는 파일 내용(bytes)을 반환합니다."""
+    col_fmt, col_button = st.columns([2, 3])
+    fmt = col_fmt.radio("📁 파일 형식", export.available_formats(), horizontal=True, key=f"{key}_format")
+    col_button.download_button(
+        label=f"{label} ({fmt})",
+        data=lambda: build(fmt),
+        file_name=export.file_name(file_stem, fmt),
+        mime=export.mime_type(fmt),
+        on_click="ignore",
+        key=f"{key}_download",
+    )
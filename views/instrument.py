@@ -0,0 +1,56 @@
+"""페이지 실행 단계별 측정 (모든 페이지 공용).
+
+- 주소에 ?debug=1을 붙이면 페이지 하단에 이번 실행의 단계별 측정값을 보여 줍니다.
+- 환경 변수 DASHBOARD_PROFILE_LOG에 파일 경로를 지정하면 실행마다 JSONL로 기록하고,
+  디버그 화면에 페이지·단계별 p50/p95를 함께 보여 줍니다.
+둘 다 꺼져 있으면 단계 시간만 재고 크기 계산·기록은 하지 않습니다.
+"""
+import os
+
+import streamlit as st
+
+from analytics import profiling
+
+PROFILE_LOG_ENV = 'DASHBOARD_PROFILE_LOG'
+
+
+def debug_enabled():
+    return st.query_params.get('debug') == '1'
+
+
+def log_path():
+    return os.environ.get(PROFILE_LOG_ENV)
+
+
+def start(page):
+    """이번 실행의 측정을 시작합니다."""
+    return profiling.RunProfile(page, enabled=debug_enabled() or bool(log_path()))
+
+
+@st.cache_data
+def log_summary(path, modified):
+    # 기록 파일 요약 (파일이 바뀌었을 때만 다시 계산)
+    return profiling.summarize_log(path)
+
+
+def finish(profile):
+    """측정을 마치고 기록·디버그 화면을 처리합니다."""
+    profile.finish()
+    path = log_path()
+    if path:
+        profiling.append_log(path, profile)
+    if not debug_enabled():
+        return
+
+    with st.expander("🛠️ 성능 측정 (디버그)", expanded=True):
+        table = profile.table()
+        table['ms'] = table.pop('seconds') * 1000
+        table['KB'] = table.pop('bytes') / 1024
+        st.markdown("**이번 실행**")
+        st.dataframe(table.style.format({'ms': "{:,.1f}", 'KB': "{:,.1f}", 'rows': "{:,.0f}"}, na_rep="-"),
+                     use_container_width=True)
+        if path and os.path.exists(path):
+            st.markdown(f"**누적 기록** ({path})")
+            summary = log_summary(path, os.path.getmtime(path))
+            st.dataframe(summary.style.format("{:,.1f}", na_rep="-", subset=summary.columns[1:]),
+                         use_container_width=True)
@@ -0,0 +1,210 @@
+"""연도별 고객별 월별 판매량 순위 보고서 화면 (산업용·업무용 페이지 공용).
+
+계산은 analytics 패키지가 담당하고, 여기서는 단계별 캐시와 사이드바·보고서 출력만 다룹니다.
+"""
+from dataclasses import dataclass
+
+import streamlit as st
+
+from analytics import export, units
+from analytics.matrix import build_monthly_matrix, report_window
+from analytics.prefetch import Prefetcher
+from analytics.report import MONTH_LABELS, render_table, report_styles
+from views.export import download_section
+from views.shared import query_backend, shared_dataset, summary_stats
+
+# 보고서 표 한 화면 행 수 (긴 순위 범위는 구간별로 나눠 전송)
+PAGE_SIZE_OPTIONS = [50, 100, 500, "전체"]
+
+# 원본 직접 조회 기간 단위
+RAW_PERIODS = ["분기", "월", "연도"]
+
+# 고객×월 행렬 캐시 크기 (연도·상품·지표 조합 수, 넘치면 가장 오래 쓰이지 않은 행렬부터 버림)
+MATRIX_CACHE_SIZE = 16
+
+
+@dataclass
+class ReportFilters:
+    summary_name: str
+    selected_year: int
+    products: tuple
+    unit_option: str
+    target_col: str
+    min_value: float
+    start_rank: int
+    end_rank: int
+    total_rows: int
+    row_from: int
+    row_to: int
+
+
+@st.cache_resource
+def matrix_prefetcher():
+    # 고객×월 행렬 LRU 캐시와 선계산 스레드 풀 (읽기 전용이라 세션 간 공유)
+    # 작업 스레드에서는 Streamlit 캐시를 부르지 않도록 공유 데이터셋을 미리 잡아 둠
+    dataset = shared_dataset()
+    names = dataset.customer_names()
+
+    def compute(key):
+        # 선택한 연도·상품 분할만 읽어서 만듦
+        summary_name, year, metric, products = key
+        products = list(products) if products is not None else None
+        rows = dataset.partition(summary_name, year, products)
+        return build_monthly_matrix(rows, year, metric, names, products)
+
+    return Prefetcher(compute, maxsize=MATRIX_CACHE_SIZE)
+
+
+def load_monthly_matrix(summary_name, year, metric, products=None):
+    """연도·상품·지표별 고객×월 행렬 (순위 범위·최소 합계 변경 시 재사용)."""
+    return matrix_prefetcher().get((summary_name, year, metric, products))
+
+
+def prefetch_neighbours(summary_name, year, metric, products=None):
+    """다음에 고를 가능성이 큰 행렬(앞뒤 연도, 다른 지표)을 백그라운드에서 미리 만듭니다."""
+    years = summary_stats(summary_name).years
+    position = years.index(year)
+    neighbours = [years[i] for i in (position - 1, position + 1) if 0 <= i < len(years)]
+    metrics = dict.fromkeys(col for col, _ in units.UNITS.values())
+    keys = [(summary_name, y, metric, products) for y in neighbours]
+    keys += [(summary_name, year, other, products) for other in metrics if other != metric]
+    matrix_prefetcher().prefetch(keys)
+
+
+@st.cache_data
+def render_report_table(summary_name, year, metric, products, unit_option, start_rank, end_rank, min_value, row_from, row_to):
+    # 보고서 표 HTML (조회 조건·표시 구간별 캐시). 선택범위 합계는 전체 조회 범위 기준
+    matrix = load_monthly_matrix(summary_name, year, metric, products)
+    values, total = report_window(matrix, start_rank, end_rank, min_value, unit_option)
+    return render_table(values.iloc[row_from:row_to], total)
+
+
+@st.cache_data
+def report_export(summary_name, year, metric, products, unit_option, start_rank, end_rank, min_value, fmt):
+    # 내려받기 파일 (표시 구간이 아닌 조회 범위 전체, 요청했을 때만 만들고 조건·형식별로 캐시)
+    matrix = load_monthly_matrix(summary_name, year, metric, products)
+    values, _ = report_window(matrix, start_rank, end_rank, min_value, unit_option)
+    return export.export_bytes(values.rename(columns=MONTH_LABELS), fmt)
+
+
+@st.cache_data
+def query_raw_top(period, year, metric, products, top_n):
+    # 원본에서 기간별 TOP N (연도·상품 조건과 순위 계산은 DuckDB 안에서 처리)
+    return query_backend().top_customers(metric, period, year, year, list(products), top_n=top_n)
+
+
+def sidebar_overview(summary_name, title):
+    """사이드바 상단 요약 지표 (총 고객 수, 총 판매량)."""
+    st.sidebar.markdown(title)
+    stats = summary_stats(summary_name)
+    total_customers_all = stats.customers
+    total_volume_all = stats.volume
+
+    col_side1, col_side2 = st.sidebar.columns(2)
+    col_side1.metric("총 고객 수", f"{total_customers_all:,}명")
+    col_side2.metric("총 판매량(㎥)", f"{total_volume_all/1000000:,.1f}M")
+    st.sidebar.divider()
+
+
+def sidebar_filters(summary_name, default_min_base, default_end_rank, with_products=False):
+    """보고서 필터 사이드바를 그리고 선택값을 반환합니다. 해당 연도 데이터가 없으면 None."""
+    stats = summary_stats(summary_name)
+    st.sidebar.header("⚙️ 보고서 필터 설정")
+    selected_year = st.sidebar.selectbox("📅 분석 연도", stats.years)
+
+    products = None
+    if with_products:
+        all_products = list(stats.products)
+        # 선택 순서와 관계없이 같은 캐시 키가 되도록 정렬
+        products = tuple(sorted(st.sidebar.multiselect("🏷️ 용도 선택", all_products, default=all_products)))
+
+    unit_option = st.sidebar.radio("📊 분석 단위", units.UNIT_OPTIONS, index=0, horizontal=True)
+    target_col, _ = units.unit_spec(unit_option)
+    default_min = int(units.from_base(default_min_base[target_col], unit_option))
+
+    min_value = st.sidebar.number_input(f"🔍 최소 연간 합계 ({unit_option})", min_value=0, value=default_min)
+
+    matrix = load_monthly_matrix(summary_name, selected_year, target_col, products)
+    # 보고서를 읽는 동안 이웃 연도·다른 지표 행렬을 미리 계산
+    prefetch_neighbours(summary_name, selected_year, target_col, products)
+    if not len(matrix):
+        return None
+    max_rank = len(matrix)
+
+    st.sidebar.subheader("🏆 순위 범위 및 UI 설정")
+    col_r1, col_r2 = st.sidebar.columns(2)
+    with col_r1:
+        start_rank = st.number_input("시작 순위", min_value=1, max_value=max_rank, value=1)
+    with col_r2:
+        end_rank = st.number_input("종료 순위", min_value=1, max_value=max_rank, value=min(default_end_rank, max_rank))
+
+    page_size = st.sidebar.selectbox("📄 한 번에 표시할 행 수", PAGE_SIZE_OPTIONS, index=1)
+
+    # 필터링 적용 (순위 범위는 슬라이싱, 최소 합계는 이진 탐색)
+    total_rows = matrix.window_size(start_rank, end_rank, units.to_base(min_value, unit_option))
+
+    # 표시 구간 (선택 범위가 길면 페이지 단위로 나눠 표시)
+    row_from, row_to = 0, total_rows
+    if page_size != "전체" and total_rows > page_size:
+        page_count = -(-total_rows // page_size)
+        page = st.sidebar.number_input(f"📑 페이지 (총 {page_count})", min_value=1, max_value=page_count, value=1)
+        row_from, row_to = (page - 1) * page_size, min(page * page_size, total_rows)
+
+    return ReportFilters(summary_name, selected_year, products, unit_option, target_col, min_value,
+                         start_rank, end_rank, total_rows, row_from, row_to)
+
+
+def show_report_table(filters, caption):
+    """보고서 표를 출력하고 전송한 HTML을 반환합니다. 조건에 맞는 행이 없으면 경고를 표시하고 None."""
+    if not filters.total_rows:
+        st.warning("조건에 맞는 데이터가 없습니다.")
+        return None
+
+    html = render_report_table(
+        filters.summary_name, filters.selected_year, filters.target_col, filters.products, filters.unit_option,
+        filters.start_rank, filters.end_rank, filters.min_value, filters.row_from, filters.row_to
+    )
+    st.markdown(html, unsafe_allow_html=True)
+    if filters.row_to - filters.row_from < filters.total_rows:
+        st.caption(f"전체 {filters.total_rows:,}행 중 {filters.row_from + 1:,}~{filters.row_to:,}행 표시 (선택범위 합계는 전체 기준)")
+    st.caption(caption)
+    return html
+
+
+def show_styles(font_size):
+    st.markdown(report_styles(font_size), unsafe_allow_html=True)
+
+
+@st.fragment
+def report_table_section(filters, caption):
+    """글자 크기 설정과 보고서 표. 글자 크기(표시 전용)를 바꾸면 이 영역만 다시 그립니다."""
+    col_font, _ = st.columns([1, 4])
+    font_size = col_font.number_input("📏 표 글자 크기 (px)", min_value=10, max_value=50, value=15)
+    show_styles(font_size)
+    return show_report_table(filters, caption)
+
+
+def show_export(filters, file_stem):
+    """보고서 내려받기 영역 (조회 범위 전체 행)."""
+    if not filters.total_rows:
+        return
+
+    def build(fmt):
+        return report_export(filters.summary_name, filters.selected_year, filters.target_col, filters.products,
+                             filters.unit_option, filters.start_rank, filters.end_rank, filters.min_value, fmt)
+
+    download_section(f"📥 보고서 {filters.total_rows:,}행 다운로드", file_stem, build, key="report_export")
+
+
+def show_raw_query(filters, products):
+    """원본 직접 조회 영역 (DuckDB 백엔드가 설정된 경우에만 표시)."""
+    if query_backend() is None or not products:
+        return
+    with st.expander("🔎 원본 직접 조회 (기간별 TOP N)"):
+        col_p, col_n = st.columns(2)
+        period = col_p.radio("기간 단위", RAW_PERIODS, horizontal=True)
+        top_n = col_n.slider("기간별 상위 업체 수", min_value=5, max_value=50, value=10)
+        rows = query_raw_top(period, filters.selected_year, filters.target_col, tuple(products), top_n)
+        rows = rows.assign(**{filters.target_col: units.from_base(rows[filters.target_col], filters.unit_option)})
+        st.dataframe(rows.style.format({filters.target_col: "{:,.0f}"}), use_container_width=True, hide_index=True)
+        st.caption(f"원본: {query_backend().source} | 단위: {filters.unit_option}")
@@ -0,0 +1,44 @@
+"""모든 페이지·세션이 함께 쓰는 데이터 로더.
+
+st.cache_data는 호출마다 역직렬화한 복사본을 돌려주므로, 요약 데이터처럼 크고 바뀌지
+않는 객체는 st.cache_resource로 프로세스당 하나만 두고 공유합니다.
+"""
+import os
+
+import streamlit as st
+
+from analytics import query, storage
+from analytics.dataset import SharedDataset
+
+# 원본 추출 파일 경로 환경 변수 (지정하고 DuckDB가 설치되어 있으면 원본 직접 조회 사용)
+RAW_EXTRACT_ENV = 'RAW_EXTRACT_PATH'
+
+
+@st.cache_resource
+def shared_dataset():
+    # 요약 데이터·고객 차원 테이블·파생 값 (서버 프로세스당 1회 로드)
+    return SharedDataset(storage.DATA_DIR)
+
+
+def load_summary(summary_name):
+    """요약 DataFrame (공유 데이터의 얕은 복사본, 수정해도 다른 세션에 영향 없음)."""
+    return shared_dataset().frame(summary_name)
+
+
+def summary_stats(summary_name):
+    """연도·상품 목록과 총 고객 수·총 판매량 (로드 시 계산된 값)."""
+    return shared_dataset().stats.get(summary_name)
+
+
+def load_customer_names():
+    """고객ID → 대표 고객명 Series."""
+    return shared_dataset().customer_names()
+
+
+@st.cache_resource
+def query_backend():
+    # 원본 직접 조회 엔진 (선택 기능, 조건이 맞지 않으면 None)
+    path = os.environ.get(RAW_EXTRACT_ENV)
+    if not path or not query.available() or not os.path.exists(path):
+        return None
+    return query.RawQuery(path)